@@ -0,0 +1,66 @@
+"""Compares two JSON results of `run.py` and flags the benchmarks which got slower or bigger.
+
+Run from the repository root with: `python benchmarks/compare.py BASE.json NEW.json [--threshold 0.1]`
+
+Exits with status 1 when a benchmark regressed by more than the threshold, so it can gate a CI job.
+"""
+import sys
+import json
+import argparse
+
+
+def compare(base, new, threshold):
+    """Compares the results of two runs, all lower-is-better.
+
+    Args:
+        base (dict): The results of the reference run.
+        new (dict): The results of the run to check.
+        threshold (float): Relative change above which a benchmark is flagged, like 0.1 for 10%.
+
+    Returns:
+        list: A `(name, base value, new value, relative change, flag)` tuple per benchmark of either run,
+        where `flag` is `regression`, `improvement`, `added`, `removed` or an empty string.
+    """
+    rows = []
+    for name in sorted(set(base) | set(new)):
+        if name not in new:
+            rows.append((name, base[name]['value'], None, None, 'removed'))
+            continue
+        if name not in base:
+            rows.append((name, None, new[name]['value'], None, 'added'))
+            continue
+        old_value, new_value = base[name]['value'], new[name]['value']
+        change = (new_value - old_value) / old_value if old_value else 0.0
+        flag = 'regression' if change > threshold else 'improvement' if change < -threshold else ''
+        rows.append((name, old_value, new_value, change, flag))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('base', help='JSON results of the reference run')
+    parser.add_argument('new', help='JSON results of the run to check')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative change flagged, defaults to 0.1')
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    print('base: %s  new: %s' % (base['meta'].get('revision'), new['meta'].get('revision')))
+    rows = compare(base['results'], new['results'], args.threshold)
+    for name, old_value, new_value, change, flag in rows:
+        print('%-36s %14s %14s %8s  %s' % (
+            name,
+            '-' if old_value is None else '%.1f' % old_value,
+            '-' if new_value is None else '%.1f' % new_value,
+            '-' if change is None else '%+.1f%%' % (change * 100),
+            flag.upper() if flag == 'regression' else flag))
+    regressions = sum(1 for row in rows if row[4] == 'regression')
+    if regressions:
+        print('%d regression(s) above %.0f%%' % (regressions, args.threshold * 100))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
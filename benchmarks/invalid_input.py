@@ -0,0 +1,51 @@
+"""Measures the throughput of calls rejected by validation.
+
+Run from the repository root with: `python benchmarks/invalid_input.py`
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fireservice import FireService, IntegerField, StringField, ListField  # noqa: E402
+from fireservice.exceptions import ValidationError  # noqa: E402
+
+
+class Service(FireService):
+    user_id = IntegerField(min_value=1)
+    name = StringField(max_length=8)
+    tags = ListField(ListField(ListField(IntegerField(max_value=9))))
+
+    def fire(self, **kwargs):
+        pass
+
+
+VALID = {'user_id': 1, 'name': 'murphy', 'tags': [[[1, 2]], [[3]]]}
+
+CASES = [
+    ('type', {**VALID, 'user_id': 'a'}),
+    ('min_value', {**VALID, 'user_id': 0}),
+    ('max_length', {**VALID, 'name': 'endurance'}),
+    ('nested item', {**VALID, 'tags': [[[1, 2]], [[3, 10]]]}),
+    ('missing', {'user_id': 1, 'tags': [[[1, 2]] * 10] * 10}),
+]
+
+
+def measure(input, number=20000):
+    start = time.perf_counter()
+    for _ in range(number):
+        try:
+            Service().call(input)
+        except ValidationError:
+            pass
+    return number / (time.perf_counter() - start)
+
+
+def main():
+    for name, input in CASES:
+        print('%-12s: %9.0f rejected calls/s' % (name, measure(input)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Measures the per-element cost of `ListField` validation.
+
+Run from the repository root with: `python benchmarks/listfield.py`
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fireservice import FireService, ListField, IntegerField, StringField  # noqa: E402
+
+
+class Flat(FireService):
+    items = ListField(IntegerField(min_value=0))
+
+    def fire(self, **kwargs):
+        pass
+
+
+class Nested(FireService):
+    items = ListField(ListField(StringField(max_length=8)))
+
+    def fire(self, **kwargs):
+        pass
+
+
+def measure(service, value, items, repeat=3):
+    """Returns the best per-element time in nanoseconds over `repeat` calls.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        service().call({'items': value})
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e9 / items
+
+
+def main():
+    for size in (10000, 1000000):
+        print('flat   %8d items: %7.1f ns/item' % (size, measure(Flat, list(range(size)), size)))
+        rows = size // 10
+        nested = [['abc'] * 10 for _ in range(rows)]
+        print('nested %8d items: %7.1f ns/item' % (size, measure(Nested, nested, rows * 10)))
+
+
+if __name__ == '__main__':
+    main()
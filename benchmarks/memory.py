@@ -0,0 +1,64 @@
+"""Measures the memory held by live service instances and the cost of initializing them.
+
+Run from the repository root with: `python benchmarks/memory.py [instances]`, by default a million instances.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fireservice import FireService, IntegerField, StringField, BooleanField  # noqa: E402
+
+
+class DictService(FireService):
+    user_id = IntegerField()
+    name = StringField()
+    active = BooleanField()
+
+    def fire(self, **kwargs):
+        pass
+
+
+class SlottedService(FireService, slots=True):
+    user_id = IntegerField()
+    name = StringField()
+    active = BooleanField()
+
+    def fire(self, **kwargs):
+        pass
+
+
+def create(service, count):
+    input = {'user_id': 1, 'name': 'murphy', 'active': True}
+    instances = []
+    for _ in range(count):
+        s = service()
+        s._process_input(input)
+        instances.append(s)
+    return instances
+
+
+def measure(service, count):
+    start = time.perf_counter()
+    create(service, count)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    instances = create(service, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / count, elapsed * 1e9 / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for service in (DictService, SlottedService):
+        per_instance, per_call = measure(service, count)
+        print('%-14s: %6.0f bytes/instance, %6.0f ns/instance for %d live instances' % (
+            service.__name__, per_instance, per_call, count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Measures how a CPU-bound service scales over worker processes with `FireService.map()`.
+
+Run from the repository root with: `python benchmarks/process_pool.py`
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fireservice import FireService, IntegerField  # noqa: E402
+
+
+class Collatz(FireService):
+    start = IntegerField(min_value=1)
+
+    def fire(self, **kwargs):
+        longest = 0
+        for n in range(self.start, self.start + 20000):
+            steps = 0
+            while n != 1:
+                n = n // 2 if n % 2 == 0 else 3 * n + 1
+                steps += 1
+            longest = max(longest, steps)
+        return longest
+
+
+def main():
+    inputs = [{'start': 1 + i * 20000} for i in range(32)]
+    start = time.perf_counter()
+    expected = [Collatz().call(input) for input in inputs]
+    serial = time.perf_counter() - start
+    print('call()       : %6.2f s' % serial)
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            results = list(Collatz.map(inputs, executor=executor))
+            elapsed = time.perf_counter() - start
+        assert results == expected
+        print('map() %2d proc: %6.2f s, speedup %.1fx' % (workers, elapsed, serial / elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""Runs the benchmark suite and writes the results as JSON, to be compared between two runs with `compare.py`.
+
+Run from the repository root with: `python benchmarks/run.py [--quick] [--filter TEXT] [--output FILE]`
+
+It covers the overhead of `FireService.call()` by number of fields, the `default_validator` of every built-in field,
+`ListField` validation by size and nesting depth, calls rejected by validation and the memory of live instances.
+All results are lower-is-better, in nanoseconds or bytes.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import memory  # noqa: E402
+import listfield  # noqa: E402
+import invalid_input  # noqa: E402
+from fireservice import fields  # noqa: E402
+from fireservice import FireService, IntegerField, ListField  # noqa: E402
+
+
+def best_of(function, number, repeat=5):
+    """Returns the best time of `repeat` runs of `number` calls to `function`, in nanoseconds per call.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e9 / number
+
+
+def make_service(field_count):
+    namespace = {'f%d' % i: IntegerField(min_value=0) for i in range(field_count)}
+    namespace['fire'] = lambda self, **kwargs: None
+    return type('Fields%d' % field_count, (FireService,), namespace)
+
+
+def bench_call(quick):
+    for field_count in (1, 10, 50):
+        service = make_service(field_count)
+        input = {'f%d' % i: i for i in range(field_count)}
+        yield 'call.fields_%d' % field_count, 'ns/call', \
+            lambda: best_of(lambda: service().call(input), 2000 if quick else 20000)
+
+
+VALIDATOR_CASES = [
+    (fields.BooleanField(), True),
+    (fields.CharacterField(), 'a'),
+    (fields.StringField(max_length=8), 'murphy'),
+    (fields.NumericField(min_value=0), 1.5),
+    (fields.IntegerField(min_value=0), 1),
+    (fields.FloatField(min_value=0), 1.5),
+    (fields.DateField(), date(2019, 12, 4)),
+    (fields.DateTimeField(), datetime(2019, 12, 4, 10, 20, 30)),
+    (fields.DictField(), {'a': 1}),
+    (fields.EmailField(), 'murphy@endurance.com'),
+    (fields.ListField(fields.IntegerField()), [1]),
+    (fields.BytesField(max_length=8), b'murphy'),
+]
+
+
+def bench_validators(quick):
+    for field, value in VALIDATOR_CASES:
+        field.__set_name__(None, 'a')
+        yield 'validator.%s' % type(field).__name__, 'ns/op', \
+            lambda: best_of(lambda: field.default_validator(value), 20000 if quick else 200000)
+
+
+def nested_value(items, depth):
+    """Builds a list nested `depth` levels deep holding about `items` integers, every outer level having two lists.
+
+    Returns:
+        tuple: The list and its exact number of integers.
+    """
+    leaf = max(1, items // 2 ** (depth - 1))
+    value = list(range(leaf))
+    for _ in range(depth - 1):
+        value = [value, value]
+    return value, leaf * 2 ** (depth - 1)
+
+
+def make_list_service(depth):
+    field = IntegerField(min_value=0)
+    for _ in range(depth):
+        field = ListField(field)
+    return type('Depth%d' % depth, (FireService,), {'items': field, 'fire': lambda self, **kwargs: None})
+
+
+def bench_listfield(quick):
+    for items in ((10, 10000) if quick else (10, 10000, 1000000)):
+        for depth in (1, 2, 3, 4):
+            yield 'listfield.items_%d.depth_%d' % (items, depth), 'ns/item', \
+                lambda: listfield.measure(make_list_service(depth), *nested_value(items, depth), 3 if items > 10 else 1000)
+
+
+def bench_failure(quick):
+    for name, input in invalid_input.CASES:
+        yield 'failure.%s' % name.replace(' ', '_'), 'ns/call', \
+            lambda: 1e9 / invalid_input.measure(input, 2000 if quick else 20000)
+
+
+def bench_memory(quick):
+    for service in (memory.DictService, memory.SlottedService):
+        yield 'memory.%s' % service.__name__, 'bytes/instance', lambda: memory.measure(service, 10000 if quick else 100000)[0]
+
+
+SUITES = [bench_call, bench_validators, bench_listfield, bench_failure, bench_memory]
+"""Functions yielding a `(name, unit, run)` triple per benchmark, where `run()` measures it.
+"""
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--quick', action='store_true', help='fewer iterations and no 1M items list')
+    parser.add_argument('--filter', default='', help='only run the benchmarks whose name contains this text')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args()
+
+    results = {}
+    for suite in SUITES:
+        for name, unit, run in suite(args.quick):
+            if args.filter not in name:
+                continue
+            value = run()
+            results[name] = {'value': value, 'unit': unit}
+            print('%-36s %14.1f %s' % (name, value, unit), file=sys.stderr)
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'quick': args.quick,
+            'time': datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""Caches used by `FireService` classes declared with `validation_cache` or `result_cache`.
+
+Inputs are keyed by their `fingerprint()`, a hashable copy of their structure. Only inputs made of built-in immutable
+values in `dict`, `list` and `tuple` containers have a fingerprint, so an input which can change without its
+fingerprint changing, like an instance of a user class, is never served from a cache.
+"""
+import math
+import time
+import asyncio
+from threading import Lock
+from concurrent.futures import Future
+from decimal import Decimal
+from datetime import date, datetime, time as time_of_day, timedelta
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+"""Statistics of a cache, like `functools.lru_cache`.
+"""
+
+ResultCacheInfo = namedtuple('ResultCacheInfo', ['hits', 'misses', 'coalesced', 'maxsize', 'currsize'])
+"""Statistics of a `ResultCache`, where `coalesced` counts the calls which waited for an identical call in flight.
+"""
+
+_IMMUTABLE = frozenset([str, bytes, int, bool, type(None), date, timedelta])
+
+
+MAX_DEPTH = 64
+"""Maximum nesting depth of the containers of a value with a `fingerprint()`, so that hashing, comparing and copying
+cached values never exceeds the recursion limit.
+"""
+
+
+class Uncacheable(TypeError):
+    """Raised by `fingerprint()` for a value which is not made of built-in immutable values and containers.
+    """
+
+
+def fingerprint(value):
+    """Builds a hashable key describing the structure and values of `value`.
+
+    Types are part of the key, so `1`, `1.0` and `True` have different fingerprints, as well as a `list` and a `tuple`
+    of the same items. So are the details which equality ignores: the sign of zero floats, the exponent of decimals,
+    like `Decimal('1.0')` and `Decimal('1.00')`, and the `tzinfo` and `fold` of times. The key order of a `dict`
+    is not. Strings, the most common values, are their own fingerprint.
+
+    Args:
+        value (object): An input value.
+
+    Returns:
+        object: The fingerprint of `value`.
+
+    Raises:
+        Uncacheable: Raised when `value` holds a value of another type than `dict`, `list`, `tuple` and built-in
+        immutable types, or containers nested more than `MAX_DEPTH` levels deep.
+    """
+    try:
+        return _fingerprint(value, MAX_DEPTH)
+    except RecursionError:
+        raise Uncacheable('nested too deeply') from None
+
+
+def _fingerprint(value, depth):
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is dict or value_type is list or value_type is tuple:
+        if not depth:
+            raise Uncacheable('nested too deeply')
+        depth -= 1
+        if value_type is dict:
+            return dict, frozenset([(key if type(key) is str else (type(key), key),
+                                     item if type(item) is str else _fingerprint(item, depth))
+                                    for key, item in value.items()])
+        return value_type, tuple([item if type(item) is str else _fingerprint(item, depth) for item in value])
+    if value_type in _IMMUTABLE:
+        return value_type, value
+    if value_type is float:
+        return float, value, math.copysign(1.0, value)
+    if value_type is complex:
+        return complex, value, math.copysign(1.0, value.real), math.copysign(1.0, value.imag)
+    if value_type is Decimal:
+        return Decimal, str(value)
+    if value_type is datetime or value_type is time_of_day:
+        return value_type, value, value.tzinfo, value.fold
+    raise Uncacheable(value_type.__name__)
+
+
+def copy_value(value):
+    """Copies the `dict` and `list` containers of `value`, sharing the immutable values they hold.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: copy_value(item) for key, item in value.items()}
+    if value_type is list:
+        return [copy_value(item) for item in value]
+    if value_type is tuple:
+        return tuple(copy_value(item) for item in value)
+    return value
+
+
+class LRUCache:
+    """A thread-safe mapping evicting its least recently used entries beyond `maxsize` and entries older than `ttl`.
+    """
+    MISSING = object()
+    """Returned by `get()` for a key without a live entry.
+    """
+
+    def __init__(self, maxsize, ttl=None, timer=time.monotonic):
+        """
+        Args:
+            maxsize (int): The maximum number of entries.
+            ttl (float, optional): If given, entries expire this many seconds after being stored. Defaults to never.
+            timer (callable, optional): Returns the current time in seconds. Defaults to `time.monotonic`.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize should be at least 1')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        """Returns the value stored for `key`, or `MISSING`, counting a hit or a miss.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is self.MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Stores `value` for `key`, evicting the least recently used entry when full.
+        """
+        with self._lock:
+            self._store(key, value)
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return self.MISSING
+        value, expires = entry
+        if expires is not None and expires <= self._timer():
+            del self._entries[key]
+            return self.MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key, value):
+        self._entries[key] = (value, None if self.ttl is None else self._timer() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """
+        Returns:
+            CacheInfo: The counters and size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResultCache(LRUCache):
+    """An `LRUCache` of return values which also coalesces concurrent calls computing the same key.
+
+    Only the first of several identical calls in flight, from threads or from tasks of an event loop, runs the
+    computation, the others wait for its outcome. Exceptions are shared with the waiting calls but not cached.
+    Values are copied in and out of the cache with `copy_value()`.
+    """
+    _RETRY = object()
+    """Outcome of a cancelled call in flight, the calls waiting for it retry.
+    """
+
+    def __init__(self, maxsize, ttl=None, timer=time.monotonic):
+        super().__init__(maxsize, ttl, timer)
+        self.coalesced = 0
+        self._in_flight = {}
+
+    def call(self, key, function):
+        """Returns the value cached for `key`, or the value of an identical call in flight, or else `function()`.
+
+        Args:
+            key (object): A hashable key, like a `fingerprint()`.
+            function (callable): Computes the value when it is neither cached nor in flight.
+        """
+        value, future, leader = self._join(key, key, Future)
+        if future is None:
+            return copy_value(value)
+        if not leader:
+            return copy_value(future.result())
+        try:
+            value = function()
+        except BaseException as ex:
+            self._finish(key, key)
+            future.set_exception(ex)
+            raise
+        stored = copy_value(value)
+        self._finish(key, key, stored)
+        future.set_result(stored)
+        return value
+
+    async def acall(self, key, function):
+        """Asynchronous version of `call()` where `function()` returns an awaitable.
+        Calls are coalesced with the identical calls in flight on the same event loop. When the task running
+        `function()` is cancelled, one of the calls waiting for it runs `function()` again.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        while True:
+            value, future, leader = self._join(key, flight_key, loop.create_future)
+            if future is None:
+                return copy_value(value)
+            if leader:
+                break
+            value = await asyncio.shield(future)
+            if value is not self._RETRY:
+                return copy_value(value)
+        try:
+            value = await function()
+        except asyncio.CancelledError:
+            self._finish(key, flight_key)
+            future.set_result(self._RETRY)
+            raise
+        except BaseException as ex:
+            self._finish(key, flight_key)
+            future.set_exception(ex)
+            future.exception()
+            raise
+        stored = copy_value(value)
+        self._finish(key, flight_key, stored)
+        future.set_result(stored)
+        return value
+
+    def _join(self, key, flight_key, make_future):
+        with self._lock:
+            value = self._lookup(key)
+            if value is not self.MISSING:
+                self.hits += 1
+                return value, None, False
+            future = self._in_flight.get(flight_key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+            self.misses += 1
+            future = self._in_flight[flight_key] = make_future()
+            return None, future, True
+
+    def _finish(self, key, flight_key, value=LRUCache.MISSING):
+        with self._lock:
+            if value is not self.MISSING:
+                self._store(key, value)
+            del self._in_flight[flight_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.coalesced = 0
+
+    def info(self):
+        """
+        Returns:
+            ResultCacheInfo: The counters and size of the cache.
+        """
+        with self._lock:
+            return ResultCacheInfo(self.hits, self.misses, self.coalesced, self.maxsize, len(self._entries))
@@ -0,0 +1,260 @@
+"""Generates specialized `_process_input` and `validate` functions for compiled `FireService` classes.
+
+Like `dataclasses` and `attrs`, the source of a function is generated per class and `exec`-ed once. Type
+checks of the built-in fields and the `required`, `not_required`, `length` and `interval` validators are
+inlined as straight-line code. Fields with a user-defined `default_validator` (or any other overridden
+validation hook), coerced or lazy fields and unknown validators fall back to the generic path.
+"""
+import numbers
+from datetime import date, datetime
+from fireservice import fields
+from fireservice.exceptions import ValidationError, ModificationError
+
+
+class _Context:
+    """Collects the generated lines and the objects referenced from them.
+    """
+    def __init__(self):
+        self.lines = []
+        self.namespace = {
+            'NULL': fields.Field.NULL,
+            'ValidationError': ValidationError,
+            'ModificationError': ModificationError,
+            'Number': numbers.Number,
+            'date': date,
+            'datetime': datetime,
+        }
+
+    def const(self, obj):
+        name = '_c%s' % len(self.namespace)
+        self.namespace[name] = obj
+        return name
+
+    def emit(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+
+def _emit_length(ctx, indent, name, min_length, max_length):
+    if min_length is None and max_length is None:
+        return
+    ctx.emit(indent, 'n = len(v)')
+    if min_length is not None:
+        bound = ctx.const(min_length)
+        ctx.emit(indent, 'if n < %s:' % bound)
+        ctx.emit(indent + 1, "raise ValidationError(%r, code='min_length', params={'length': n, 'min_length': %s})" % (name, bound))
+    if max_length is not None:
+        bound = ctx.const(max_length)
+        ctx.emit(indent, 'if n > %s:' % bound)
+        ctx.emit(indent + 1, "raise ValidationError(%r, code='max_length', params={'length': n, 'max_length': %s})" % (name, bound))
+
+
+def _emit_interval(ctx, indent, name, min_value, max_value):
+    if min_value is not None:
+        bound = ctx.const(min_value)
+        ctx.emit(indent, 'if v < %s:' % bound)
+        ctx.emit(indent + 1, "raise ValidationError(%r, code='min_value', params={'value': v, 'min_value': %s})" % (name, bound))
+    if max_value is not None:
+        bound = ctx.const(max_value)
+        ctx.emit(indent, 'if v > %s:' % bound)
+        ctx.emit(indent + 1, "raise ValidationError(%r, code='max_value', params={'value': v, 'max_value': %s})" % (name, bound))
+
+
+def _emit_type_check(ctx, indent, name, type_name, expected):
+    ctx.emit(indent, 'if not isinstance(v, %s):' % type_name)
+    ctx.emit(indent + 1, "raise ValidationError(%r, code='type', params={'type': %r})" % (name, expected))
+
+
+def _gen_field(ctx, indent, name, field):
+    pass
+
+
+def _gen_boolean(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, ctx.const(bool), 'bool')
+
+
+def _gen_character(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, ctx.const(str), 'str')
+    ctx.emit(indent, 'if len(v) != 1:')
+    ctx.emit(indent + 1, "raise ValidationError(%r, code='length', params={'expected': 1, 'length': len(v)})" % name)
+
+
+def _gen_string(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, ctx.const(str), 'str')
+    _emit_length(ctx, indent, name, field.options.get('min_length'), field.options.get('max_length'))
+
+
+def _gen_numeric(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, 'Number', 'numeric')
+    _emit_interval(ctx, indent, name, field.options.get('min_value'), field.options.get('max_value'))
+
+
+def _gen_integer(ctx, indent, name, field):
+    _gen_numeric(ctx, indent, name, field)
+    _emit_type_check(ctx, indent, name, ctx.const(int), 'int')
+
+
+def _gen_float(ctx, indent, name, field):
+    _gen_numeric(ctx, indent, name, field)
+    _emit_type_check(ctx, indent, name, ctx.const(float), 'float')
+
+
+def _gen_date(ctx, indent, name, field):
+    ctx.emit(indent, 'if isinstance(v, datetime) or not isinstance(v, date):')
+    ctx.emit(indent + 1, "raise ValidationError(%r, code='type', params={'type': 'date'})" % name)
+
+
+def _gen_datetime(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, 'datetime', 'datetime')
+
+
+def _gen_dict(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, ctx.const(dict), 'dict')
+
+
+def _gen_email(ctx, indent, name, field):
+    _emit_type_check(ctx, indent, name, ctx.const(str), 'str')
+    ctx.emit(indent, 'if %s(v) is None:' % ctx.const(field._match))
+    ctx.emit(indent + 1, "raise ValidationError(%r, code='email')" % name)
+
+
+_GENERATORS = {
+    fields.Field.default_validator: _gen_field,
+    fields.BooleanField.default_validator: _gen_boolean,
+    fields.CharacterField.default_validator: _gen_character,
+    fields.StringField.default_validator: _gen_string,
+    fields.NumericField.default_validator: _gen_numeric,
+    fields.IntegerField.default_validator: _gen_integer,
+    fields.FloatField.default_validator: _gen_float,
+    fields.DateField.default_validator: _gen_date,
+    fields.DateTimeField.default_validator: _gen_datetime,
+    fields.DictField.default_validator: _gen_dict,
+    fields.EmailField.default_validator: _gen_email,
+}
+
+
+def _is_inlinable(field):
+    field_type = type(field)
+    return (field_type.default_validator in _GENERATORS
+            and not field.options.get('coerce')
+            and not field.options.get('lazy')
+            and field_type._init_value is fields.Field._init_value
+            and field_type._validate is fields.Field._validate
+            and field_type._run_validation is fields.Field._run_validation
+            and field_type.__set__ is fields.Field.__set__)
+
+
+def _gen_validators(ctx, indent, name, validators):
+    for validator in validators:
+        kind = getattr(validator, 'kind', None)
+        if kind == 'required':
+            ctx.emit(indent, 'if v is None:')
+            ctx.emit(indent + 1, "raise ValidationError(%r, code='required')" % name)
+        elif kind == 'not_required':
+            pass
+        elif kind == 'length':
+            _emit_length(ctx, indent, name, *validator.bounds)
+        elif kind == 'interval':
+            _emit_interval(ctx, indent, name, *validator.bounds)
+        else:
+            ctx.emit(indent, '%s(%r, v)' % (ctx.const(validator), name))
+
+
+def _gen_checks(ctx, name, field, validators):
+    ctx.emit(1, 'v = get(%r, NULL)' % name)
+    ctx.emit(1, 'if v is NULL:')
+    ctx.emit(2, 'v = %s' % ctx.const(field.options['default']))
+    _gen_validators(ctx, 1, name, validators)
+    ctx.emit(1, 'if v is not None:')
+    start = len(ctx.lines)
+    _GENERATORS[type(field).default_validator](ctx, 2, name, field)
+    if len(ctx.lines) == start:
+        ctx.emit(2, 'pass')
+
+
+def _gen_inline(ctx, schema, name, field, validators):
+    _gen_checks(ctx, name, field, validators)
+    if name in schema.setters:
+        ctx.emit(1, '%s(self, v)' % ctx.const(schema.setters[name]))
+        return
+    ctx.emit(1, 'if flags.get(%r):' % name)
+    ctx.emit(2, "raise ModificationError('Attempt to change field: %s')" % name)
+    ctx.emit(1, 'values[%r] = v' % name)
+    ctx.emit(1, 'flags[%r] = True' % name)
+
+
+def _gen_generic(ctx, name, field, validators):
+    ctx.emit(1, '%s(self, get(%r, NULL), %s)' % (ctx.const(field._init_value), name, ctx.const(validators)))
+
+
+def _gen_prechecks(ctx, schema):
+    ctx.emit(1, '%s(input)' % ctx.const(schema.check_keys))
+    if schema.required:
+        ctx.emit(1, 'if not input.keys() >= %s:' % ctx.const(frozenset(schema.required)))
+        ctx.emit(2, '%s(input)' % ctx.const(schema.check_required))
+    ctx.emit(1, 'get = input.get')
+
+
+def _build(ctx, qualname, function_name):
+    source = '\n'.join(ctx.lines) + '\n'
+    exec(compile(source, '<fireservice compiled %s>' % qualname, 'exec'), ctx.namespace)
+    function = ctx.namespace[function_name]
+    function.__qualname__ = '%s.%s' % (qualname, function_name)
+    return function, source
+
+
+def compile_process_input(schema, qualname='FireService'):
+    """Generates a `_process_input(self, input)` function specialized for `schema`.
+
+    Args:
+        schema (Schema): The compiled schema of a `FireService` class.
+        qualname (str, optional): Qualified name of the class, used to name the generated function.
+
+    Returns:
+        tuple: The generated function and its source.
+    """
+    ctx = _Context()
+    ctx.emit(0, 'def _process_input(self, input):')
+    _gen_prechecks(ctx, schema)
+    if schema.setters:
+        ctx.emit(1, "if getattr(self, '_frozen', False):")
+        ctx.emit(2, "raise ModificationError('Attempt to change field: %s')" % schema.fields[0][0])
+    if not schema.slotted:
+        ctx.emit(1, 'values = self.__dict__')
+        ctx.emit(1, "flags = values.get('_field_flags')")
+        ctx.emit(1, 'if flags is None:')
+        ctx.emit(2, "flags = values['_field_flags'] = {}")
+    for name, field, validators in schema.ordered:
+        if _is_inlinable(field):
+            _gen_inline(ctx, schema, name, field, validators)
+        else:
+            _gen_generic(ctx, name, field, validators)
+    return _build(ctx, qualname, '_process_input')
+
+
+def compile_validate(schema, qualname='FireService'):
+    """Generates a `validate(input)` function specialized for `schema`, which returns the validated values
+    of all fields in declaration order instead of assigning them to an instance. Fields are validated in the
+    validation order of the schema, into local variables gathered by the returned `dict` display.
+
+    Args:
+        schema (Schema): The compiled schema of a `FireService` class.
+        qualname (str, optional): Qualified name of the class, used to name the generated function.
+
+    Returns:
+        tuple: The generated function and its source.
+    """
+    ctx = _Context()
+    ctx.emit(0, 'def validate(input):')
+    _gen_prechecks(ctx, schema)
+    local_names = {name: 'f%d' % index for index, (name, _) in enumerate(schema.fields)}
+    for name, field, validators in schema.ordered:
+        if _is_inlinable(field):
+            _gen_checks(ctx, name, field, validators)
+            ctx.emit(1, '%s = v' % local_names[name])
+        else:
+            ctx.emit(1, 'v = get(%r, NULL)' % name)
+            ctx.emit(1, 'if v is NULL:')
+            ctx.emit(2, 'v = %s' % ctx.const(field.options['default']))
+            ctx.emit(1, '%s = %s(v, %s)' % (local_names[name], ctx.const(field._validate), ctx.const(validators)))
+    ctx.emit(1, 'return {%s}' % ', '.join('%r: %s' % (name, local_names[name]) for name, _ in schema.fields))
+    return _build(ctx, qualname, 'validate')
@@ -0,0 +1,127 @@
+"""Columnar batch validation of `FireService` inputs.
+
+A batch is given as a dictionary of columns, one per field, where each column holds the values of all rows.
+When NumPy is installed, the type and range/length checks of `BooleanField`, `NumericField`, `IntegerField`,
+`FloatField` and `StringField` over NumPy array columns are applied as vectorized array operations.
+Any other column or field is validated row by row with the regular field validation.
+"""
+from fireservice import fields
+from fireservice.exceptions import FireServiceError, ValidationError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_VECTORIZED = {
+    fields.BooleanField.default_validator: ('b', None),
+    fields.NumericField.default_validator: ('biuf', ('min_value', 'max_value')),
+    fields.IntegerField.default_validator: ('biu', ('min_value', 'max_value')),
+    fields.FloatField.default_validator: ('f', ('min_value', 'max_value')),
+    fields.StringField.default_validator: ('U', ('min_length', 'max_length')),
+}
+"""Maps the default validator of a field type to the NumPy dtype kinds it accepts and its bound options.
+"""
+
+
+def _is_vectorizable(field, validators, column):
+    if numpy is None or not isinstance(column, numpy.ndarray) or column.ndim != 1 or column.dtype.kind not in 'biufU':
+        return False
+    if field.options.get('coerce'):
+        return False
+    field_type = type(field)
+    if field_type.default_validator not in _VECTORIZED or field_type._validate is not fields.Field._validate \
+            or field_type._run_validation is not fields.Field._run_validation:
+        return False
+    for validator in validators:
+        kind = getattr(validator, 'kind', None)
+        if kind in ('required', 'not_required'):
+            continue
+        if kind == 'length' and column.dtype.kind == 'U':
+            continue
+        if kind == 'interval' and column.dtype.kind in 'biuf':
+            continue
+        return False
+    return True
+
+
+def _bounds_mask(values, min_bound, max_bound):
+    mask = numpy.zeros(len(values), dtype=bool)
+    if min_bound is not None:
+        mask |= values < min_bound
+    if max_bound is not None:
+        mask |= values > max_bound
+    return mask
+
+
+def _vectorized_errors(field, validators, column):
+    kinds, bound_options = _VECTORIZED[type(field).default_validator]
+    if column.dtype.kind not in kinds:
+        return list(range(len(column)))
+    mask = numpy.zeros(len(column), dtype=bool)
+    if column.dtype.kind == 'U':
+        lengths = numpy.char.str_len(column)
+        for validator in validators:
+            if validator.kind == 'length':
+                mask |= _bounds_mask(lengths, *validator.bounds)
+        mask |= _bounds_mask(lengths, field.options.get(bound_options[0]), field.options.get(bound_options[1]))
+    else:
+        for validator in validators:
+            if validator.kind == 'interval':
+                mask |= _bounds_mask(column, *validator.bounds)
+        if bound_options:
+            mask |= _bounds_mask(column, field.options.get(bound_options[0]), field.options.get(bound_options[1]))
+    return numpy.flatnonzero(mask).tolist()
+
+
+def _row_errors(field, validators, column):
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        column = column.tolist()
+    errors = []
+    validate = field._validate
+    for idx, value in enumerate(column):
+        try:
+            validate(value, validators)
+        except ValidationError:
+            errors.append(idx)
+    return errors
+
+
+def validate_columns(schema, columns):
+    """Validates a batch of inputs given as columns against `schema`.
+
+    Args:
+        schema (Schema): The compiled schema of a `FireService` class.
+        columns (dict): Maps field names to columns, either lists, tuples or NumPy arrays, all of the same length.
+        A field without a column takes its default value for every row.
+
+    Returns:
+        dict: Maps the name of every field having invalid rows to the sorted list of their indices.
+
+    Raises:
+        UnknownParameterError: Raised when `columns` has a key which doesn't match any declared field.
+        FireServiceError: Raised when the columns have different lengths.
+    """
+    schema.check_keys(columns)
+    lengths = set(len(column) for column in columns.values())
+    if len(lengths) > 1:
+        raise FireServiceError('All columns should have the same length')
+    rows = lengths.pop() if lengths else 0
+
+    errors = {}
+    for name, field, validators in schema.chains:
+        column = columns.get(name, fields.Field.NULL)
+        if column is fields.Field.NULL:
+            try:
+                field._validate(field.options['default'], validators)
+                invalid = []
+            except ValidationError:
+                invalid = list(range(rows))
+        elif _is_vectorizable(field, validators, column):
+            invalid = _vectorized_errors(field, validators, column)
+        else:
+            invalid = _row_errors(field, validators, column)
+        if invalid:
+            errors[name] = invalid
+    return errors
@@ -8,18 +8,101 @@ class SkipError(FireServiceError):
     """
 
 
+MESSAGES = {
+    'required': 'Required field cannot be empty',
+    'type': 'Not of %(type)s type',
+    'length': 'Should have length: %(expected)s but has length: %(length)s',
+    'min_length': 'Provided length: %(length)s is less than min length: %(min_length)s',
+    'max_length': 'Provided length: %(length)s is greater than max length: %(max_length)s',
+    'min_value': 'Given value: %(value)s is less than min: %(min_value)s',
+    'max_value': 'Given value: %(value)s is greater than max: %(max_value)s',
+    'email': 'Not a valid email',
+    'parse': 'Not a valid %(type)s string',
+    'prefix': 'Does not start with an expected prefix',
+    'encoding': 'Not valid %(encoding)s data',
+    'unknown': 'Unknown parameter',
+    'invalid': 'Not a valid value',
+}
+"""Message templates of the error codes of built-in fields and validators, formatted with the error `params`.
+"""
+
+
 class ValidationError(FireServiceError):
     """This exception contains input validation errors.
+
+    Errors of built-in fields and validators carry a structured `code` and `params` and their message is only
+    formatted when read, so rejecting invalid input stays cheap. The path of a `ListField` item or of a
+    `SchemaField` key is also built only when `field` is read.
     """
-    def __init__(self, field, error):
+    def __init__(self, field, error=None, code=None, params=None):
         """
         Args:
             field ([str]): The name of the field in `FireService` class.
-            error ([str]): The error description.
+            error ([str], optional): The error description. Defaults to the message of `code`.
+            code ([str], optional): A code identifying the error, like `type` or `min_length`. See `MESSAGES`.
+            params (dict, optional): Values describing the error, used to format the message of `code`.
+        """
+        super().__init__(field, error, code, params)
+        self._field = field
+        self._error = error
+        self._segments = None
+        self.code = code
+        self.params = params
+
+    def _prepend(self, name, idx=None):
+        """Prefixes the path of this error with the item `idx` of the list field `name`,
+        or with the nested field `name` when `idx` is None.
+        """
+        if self._segments is None:
+            self._segments = []
+        self._segments.append((name, idx))
+
+    @property
+    def field(self):
+        """The path of the invalid field, like `name`, `name[0][1]` or `name[0].key`.
+        """
+        if self._segments:
+            self._field = ''.join('%s.' % name if idx is None else '%s[%s]' % (name, idx)
+                                  for name, idx in reversed(self._segments)) + (self._field or '')
+            self._segments = None
+        return self._field
+
+    @property
+    def error(self):
+        """The error description.
+        """
+        if self._error is None:
+            message = MESSAGES.get(self.code, self.code)
+            self._error = message % self.params if self.params else message
+        return self._error
+
+    def __str__(self):
+        return 'Field "%s": %s' % (self.field, self.error)
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.field, self.error)
+
+    def __reduce__(self):
+        return type(self), (self.field, self._error, self.code, self.params)
+
+
+class AggregateValidationError(ValidationError):
+    """This exception contains all input validation errors of a call made in `collect_errors` mode.
+    """
+    def __init__(self, errors, truncated=False):
+        """
+        Args:
+            errors ([ValidationError]): The collected errors, in validation order.
+            truncated (bool, optional): True if more errors than the maximum were found, in which case validation stopped and only the first ones are reported.
         """
-        super().__init__('Field "%s": %s' % (field, error))
-        self.field = field
-        self.error = error
+        super().__init__(errors[0].field, '%s validation errors%s' % (len(errors), ' (truncated)' if truncated else ''))
+        self.errors = {error.field: error for error in errors}
+        """Maps the path of every invalid field, like `name` or `name[0][1]`, to its `ValidationError`.
+        """
+        self.truncated = truncated
+
+    def __reduce__(self):
+        return type(self), (list(self.errors.values()), self.truncated)
 
 
 class UnknownParameterError(FireServiceError):
@@ -1,12 +1,75 @@
 import re
+import math
+import mmap
+import codecs
 import numbers
+from functools import lru_cache
 from datetime import date, datetime
-from fireservice import validators 
-from fireservice.exceptions import FireServiceError, ValidationError, ModificationError
+from fireservice import validators, jsonbackend
+from fireservice.validators import flatten as flatten_validators
+from fireservice.exceptions import FireServiceError, ValidationError, AggregateValidationError, ModificationError
+
+
+EMAIL_PATTERN = r'[^@]+@[^@]+\.[^@]+'
+"""Pattern which a value of `EmailField` should fully match.
+"""
+
+EMAIL_LOCAL_PATTERN = r'[^@]+'
+"""Local part of `EMAIL_PATTERN`.
+"""
+EMAIL_DOMAIN_PATTERN = r'[^@]+\.[^@]+'
+"""Domain of `EMAIL_PATTERN`.
+"""
+
+STRICT_EMAIL_LOCAL_PATTERN = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+"""Dot-atom local part of RFC 5322, without quoted strings and comments.
+"""
+STRICT_EMAIL_DOMAIN_PATTERN = r'(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+(?:[A-Za-z]{2,63}|xn--[A-Za-z0-9-]{1,59})'
+"""Host name of dot separated labels, ending with an alphabetic or IDNA top-level domain.
+"""
+STRICT_EMAIL_PATTERN = r'(?=[^@]{1,64}@)(?=.{1,254}$)%s@%s' % (STRICT_EMAIL_LOCAL_PATTERN, STRICT_EMAIL_DOMAIN_PATTERN)
+"""Pattern which a value of `EmailField` declared with `strict=True` should fully match, an RFC 5322 subset
+limiting the local part to 64 and the address to 254 characters.
+"""
+
+_EMAIL_PATTERNS = {
+    False: (re.compile(EMAIL_PATTERN), re.compile(EMAIL_LOCAL_PATTERN), re.compile(EMAIL_DOMAIN_PATTERN)),
+    True: (re.compile(STRICT_EMAIL_PATTERN), re.compile(STRICT_EMAIL_LOCAL_PATTERN),
+           re.compile(STRICT_EMAIL_DOMAIN_PATTERN)),
+}
+
+INTEGER_PATTERN = r'-?(?:0|[1-9][0-9]*)'
+"""Pattern which a string coerced by `IntegerField` should fully match, a JSON integer.
+"""
+NUMBER_PATTERN = INTEGER_PATTERN + r'(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?'
+"""Pattern which a string coerced by `FloatField` should fully match, a JSON number.
+"""
+
+_match_integer = re.compile(INTEGER_PATTERN).fullmatch
+_match_number = re.compile(NUMBER_PATTERN).fullmatch
+
+
+def _bounds_validator(validator):
+    """Returns the `length` or `interval` validator built for the bounds of a field, or None when it is unbounded.
+    """
+    return None if validator.is_noop else validator
+
+
+class _Pending:
+    """The provided value of a lazy field which was not read yet.
+    """
+    __slots__ = ('value', 'validators')
+
+    def __init__(self, value, validators):
+        self.value = value
+        self.validators = validators
 
 
 class Field:
     """Base class for all `Field` types
+
+    A `Field` is shared by all instances of a `FireService` class and keeps no per-call state, values are stored on the instance.
+    So a service class can be called from many threads at once.
     
     Raises:
         ModificationError: Raised when a `Field` value is modified. All field values are immutable and initialized during `FireService` instantination.
@@ -19,6 +82,16 @@ class Field:
     """Special value to denote fields which have not been initialized.
     """
 
+    COST = 1
+    """Estimated relative cost of the type check of this `Field` type, see `cost()`.
+    """
+    COERCE_COST = 2
+    """Estimated relative cost of `coerce()`, added when the field is declared with `coerce=True`.
+    """
+    EXPECTED_LENGTH = 16
+    """Length assumed by `cost()` for values of container fields declared without `max_length`.
+    """
+
     def __init__(self, default=None, validators=[validators.required()], **options):
         """
         Args:
@@ -27,6 +100,14 @@ class Field:
             Validators are functions with signature: `validator(name, value)` where `name` is attribute name of a `FireService` field and `value` is the provided value.
             Defaults to [validators.required()] which means that all fields are required by default.
             Explicitly set this option as [validators.not_required()] to make this field optional.
+            coerce (bool, optional): If True, the provided value is converted by `coerce()` before validation,
+            like ISO-8601 strings to dates or numeric strings to numbers. Defaults to False.
+            lazy (bool, optional): If True, the provided value is only validated when the field is first read, and
+            the validated value is kept for later reads. A `ValidationError` is then raised by the read, from within
+            `pre_fire()`, `fire()` or `post_fire()`, and a call which never reads the field never validates it.
+            Fields are validated eagerly anyway by `FireService.submit()`, `map()`, `validate_columns()`, by
+            services declared with `collect_errors` or `validation_cache`, and as items of other fields.
+            Not supported by services declared with `slots=True`. Defaults to False.
         """
         self.options = {}
         """The keyword arguments provided to `Field`.
@@ -37,6 +118,7 @@ class Field:
         self.options['default'] = default
         self.options['validators'] = validators
         self.options.update(**options)
+        self._validators = tuple(flatten_validators(validators))
 
     def __set_name__(self, owner, name):
         self.name = name
@@ -44,32 +126,98 @@ class Field:
         """
 
     def __get__(self, instance, instance_type):
-        return instance.__dict__.get(self.name)
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name)
+        if type(value) is _Pending:
+            value = instance.__dict__[self.name] = self._validate(value.value, value.validators)
+        return value
 
     def __set__(self, instance, value):
         mod_dict = instance.__dict__.get(self._MOD_FLAG_KEY)
-        if mod_dict and mod_dict.get(self.name):
+        if mod_dict is None:
+            mod_dict = instance.__dict__[self._MOD_FLAG_KEY] = {}
+        elif mod_dict.get(self.name):
             raise ModificationError('Attempt to change field: %s' % self.name)
         instance.__dict__[self.name] = value
-        if not mod_dict:
-            instance.__dict__[self._MOD_FLAG_KEY] = {}
-        instance.__dict__[self._MOD_FLAG_KEY][self.name] = True
+        mod_dict[self.name] = True
 
-    def _init_value(self, instance, input_value):
-        if input_value == self.NULL:
+    def _init_value(self, instance, input_value, validators=None):
+        if input_value is self.NULL:
             value = self.options['default']
         else:
             value = input_value
-        self._run_validation(value)
-        setattr(instance, self.name, value)
+        if self.options.get('lazy'):
+            setattr(instance, self.name, _Pending(value, validators))
+            return
+        setattr(instance, self.name, self._validate(value, validators))
+
+    def _validate(self, value, validators=None):
+        if value is not None and self.options.get('coerce'):
+            value = self.coerce(value)
+        self._run_validation(value, validators)
+        return value
 
-    def _run_validation(self, value):
-        for validator in self.options['validators']:
+    def _collect(self, value, validators, errors, max_errors):
+        """Like `_validate` but appends errors to `errors` instead of raising, adding at most `max_errors` of them.
+        """
+        try:
+            return self._validate(value, validators)
+        except ValidationError as ex:
+            errors.append(ex)
+
+    def _run_validation(self, value, validators=None):
+        if validators is None:
+            validators = self._validators
+        for validator in validators:
             validator(self.name, value)
         if value is None:
             return
         self.default_validator(value)
 
+    def cost(self, length=None):
+        """Estimates the relative cost of validating a value, used to validate cheap fields first.
+        It is constant for scalar fields and proportional to the length of the value for container fields.
+
+        Args:
+            length (int, optional): The length of the value of a container field. Defaults to its `max_length`
+            or `EXPECTED_LENGTH`.
+
+        Returns:
+            int: The estimated cost, 0 for lazy fields which are not validated by the call itself.
+        """
+        if self.options.get('lazy'):
+            return 0
+        cost = self.COST + len(self._validators) + self._content_cost(length)
+        if self.options.get('coerce'):
+            cost += self.COERCE_COST
+        return cost
+
+    def _content_cost(self, length):
+        """Estimated cost of validating the content of a container value, like the items of a list.
+        """
+        return 0
+
+    def _expected_length(self, length):
+        if length is not None:
+            return length
+        return self.options.get('max_length') or self.EXPECTED_LENGTH
+
+    def coerce(self, value):
+        """Converts the provided value to the type of this `Field`, only called when the field is declared with `coerce=True`.
+        Values which are already of the right type, or which can't be converted, should be returned unchanged for validation to handle.
+
+        Args:
+            value (object): The provided value when starting the service, never None.
+
+        Returns:
+            object: The converted value.
+
+        Raises:
+            ValidationError: Raised when the value has the input type of a conversion but can't be converted.
+        """
+        return value
+
     def default_validator(self, value):
         """The default validator for a `Field` type which will always be applied after all user supplied validators.
 
@@ -90,7 +238,7 @@ class BooleanField(Field):
 
     def default_validator(self, value):
         if not isinstance(value, bool):
-            raise ValidationError(self.name, 'Not of bool type')
+            raise ValidationError(self.name, code='type', params={'type': 'bool'})
 
 
 class CharacterField(Field):
@@ -101,10 +249,10 @@ class CharacterField(Field):
 
     def default_validator(self, value):
         if not isinstance(value, str):
-            raise ValidationError(self.name, 'Not of str type')
+            raise ValidationError(self.name, code='type', params={'type': 'str'})
         length = len(value)
         if length == 0 or length > 1:
-            raise ValidationError(self.name, 'Should have length: 1 but has length: %s' % length)
+            raise ValidationError(self.name, code='length', params={'expected': 1, 'length': length})
 
 
 class StringField(Field):
@@ -117,12 +265,68 @@ class StringField(Field):
             max_length ([type], optional): The maximum length of string. Defaults to unbounded.
         """
         super().__init__(min_length=min_length, max_length=max_length, **options)
+        self._length = _bounds_validator(validators.length(min_length=min_length, max_length=max_length))
 
     def default_validator(self, value):
         if not isinstance(value, str):
-            raise ValidationError(self.name, 'Not of str type')
-        validator = validators.length(min_length=self.options.get('min_length'), max_length=self.options.get('max_length'))
-        validator(self.name, value)
+            raise ValidationError(self.name, code='type', params={'type': 'str'})
+        if self._length is not None:
+            self._length(self.name, value)
+
+
+class BytesField(Field):
+    """`Field` which takes binary data: a `bytes`, `bytearray`, `memoryview` or `mmap` object.
+
+    The value is stored as provided and every check reads the buffer in place, so large payloads are never copied.
+    Non-contiguous buffers, like a strided `memoryview`, are rejected.
+    """
+    UTF8_CHUNK_SIZE = 1 << 16
+    """Number of bytes decoded at a time when checking UTF-8 validity.
+    """
+    COST = 2
+
+    def __init__(self, min_length=None, max_length=None, prefix=None, utf8=False, **options):
+        """
+        Args:
+            min_length (int, optional): The minimum size in bytes. Defaults to unbounded.
+            max_length (int, optional): The maximum size in bytes. Defaults to unbounded.
+            prefix (bytes or tuple, optional): If given, the data should start with this prefix, like the magic number
+            of a file format, or with one of the prefixes of a tuple.
+            utf8 (bool, optional): If True, the data should be valid UTF-8. Defaults to False.
+        """
+        if isinstance(prefix, (bytes, bytearray)):
+            prefix = (bytes(prefix),)
+        super().__init__(min_length=min_length, max_length=max_length, prefix=prefix, utf8=utf8, **options)
+        self._length = _bounds_validator(validators.length(min_length=min_length, max_length=max_length))
+
+    def default_validator(self, value):
+        if not isinstance(value, (bytes, bytearray, memoryview, mmap.mmap)):
+            raise ValidationError(self.name, code='type', params={'type': 'bytes'})
+        with memoryview(value) as view:
+            if not view.contiguous:
+                raise ValidationError(self.name, code='type', params={'type': 'bytes'})
+            if view.format != 'B' or view.ndim != 1:
+                view = view.cast('B')
+            if self._length is not None:
+                self._length(self.name, view)
+            prefix = self.options.get('prefix')
+            if prefix is not None and not any(view[:len(expected)] == expected for expected in prefix):
+                raise ValidationError(self.name, code='prefix')
+            if self.options.get('utf8'):
+                self._check_utf8(view)
+
+    def _content_cost(self, length):
+        return self._expected_length(length) // 64 if self.options.get('utf8') else 0
+
+    def _check_utf8(self, view):
+        decode = codecs.getincrementaldecoder('utf-8')().decode
+        chunk_size = self.UTF8_CHUNK_SIZE
+        try:
+            for start in range(0, len(view), chunk_size):
+                decode(view[start:start + chunk_size])
+            decode(b'', True)
+        except UnicodeDecodeError:
+            raise ValidationError(self.name, code='encoding', params={'encoding': 'UTF-8'}) from None
 
 
 class NumericField(Field):
@@ -135,49 +339,91 @@ class NumericField(Field):
             max_value (int], optional): If given, the provided value should be less than this.
         """
         super().__init__(min_value=min_value, max_value=max_value, **options)
+        self._interval = _bounds_validator(validators.interval(min_value=min_value, max_value=max_value))
 
     def default_validator(self, value):
         if not isinstance(value, numbers.Number):
-            raise ValidationError(self.name, 'Not of numeric type')
-        validator = validators.interval(min_value=self.options.get('min_value'), max_value=self.options.get('max_value'))
-        validator(self.name, value)
+            raise ValidationError(self.name, code='type', params={'type': 'numeric'})
+        if self._interval is not None:
+            self._interval(self.name, value)
 
 
 class IntegerField(NumericField):
-    """Field which takes an `int` type.
+    """Field which takes an `int` type. With `coerce=True` it also takes strings of JSON integers like `'42'`.
     """
+    def coerce(self, value):
+        if isinstance(value, str):
+            if _match_integer(value) is not None:
+                try:
+                    return int(value)
+                except ValueError:
+                    pass
+            raise ValidationError(self.name, code='parse', params={'type': 'int'})
+        return value
+
     def default_validator(self, value):
         super().default_validator(value)
         if not isinstance(value, int):
-            raise ValidationError(self.name, 'Not of int type')
+            raise ValidationError(self.name, code='type', params={'type': 'int'})
 
 
 class FloatField(NumericField):
-    """Field which takes a `float` type.
+    """Field which takes a `float` type. With `coerce=True` it also takes strings of JSON numbers like `'4.2'`
+    and integers. Coerced values should be finite, so `'nan'`, `'inf'` or `'1e400'` are rejected.
     """
+    def coerce(self, value):
+        if isinstance(value, str):
+            if _match_number(value) is not None:
+                value = float(value)
+                if math.isfinite(value):
+                    return value
+            raise ValidationError(self.name, code='parse', params={'type': 'float'})
+        if isinstance(value, int) and not isinstance(value, bool):
+            try:
+                return float(value)
+            except OverflowError:
+                raise ValidationError(self.name, code='parse', params={'type': 'float'}) from None
+        return value
+
     def default_validator(self, value):
         super().default_validator(value)
         if not isinstance(value, float):
-            raise ValidationError(self.name, 'Not of float type')
+            raise ValidationError(self.name, code='type', params={'type': 'float'})
 
 
 class DateField(Field):
-    """Field which takes a `date` type
+    """Field which takes a `date` type. With `coerce=True` it also takes ISO-8601 strings like `'2019-12-04'`.
     """
+    def coerce(self, value):
+        if isinstance(value, str):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                raise ValidationError(self.name, code='parse', params={'type': 'date'})
+        return value
+
     def default_validator(self, value):
         if isinstance(value, datetime) or not isinstance(value, date):
-            raise ValidationError(self.name, 'Not of date type')
+            raise ValidationError(self.name, code='type', params={'type': 'date'})
 
 
 class DateTimeField(Field):
-    """Field which takes a `datetime` type.
+    """Field which takes a `datetime` type. With `coerce=True` it also takes ISO-8601 strings like `'2019-12-04T10:20:30Z'`.
     """
     def __init__(self, **options):
         super().__init__(**options)
 
+    def coerce(self, value):
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+            except ValueError:
+                raise ValidationError(self.name, code='parse', params={'type': 'datetime'})
+        return value
+
     def default_validator(self, value):
         if not isinstance(value, datetime):
-            raise ValidationError(self.name, 'Not of datetime type')
+            raise ValidationError(self.name, code='type', params={'type': 'datetime'})
 
 
 class DictField(Field):
@@ -188,28 +434,171 @@ class DictField(Field):
 
     def default_validator(self, value):
         if not isinstance(value, dict):
-            raise ValidationError(self.name, 'Not of dict type')
+            raise ValidationError(self.name, code='type', params={'type': 'dict'})
+
+
+class SchemaField(DictField):
+    """Field which takes a `dict` validated against the fields of another `FireService` class.
+
+    The nested `dict` is validated by the schema of `service`, compiled when `service` is declared with `compiled=True`,
+    without instantiating it. The field value is a new `dict` holding the validated value of every field of `service`.
+    Errors are reported with paths like `name.key`, or `name[0].key` when used as the item of a `ListField`.
+    """
+    def __init__(self, service, **options):
+        """
+        Args:
+            service (type): A `FireService` subclass declaring the fields of the nested `dict`.
+        """
+        super().__init__(**options)
+        self.service = service
+        self._costing = False
+
+    def _content_cost(self, length):
+        if self._costing:
+            # A recursive schema, like a tree node holding a list of nodes, is costed one level deep.
+            return 0
+        self._costing = True
+        try:
+            return sum(field.cost() for _, field in self.service._get_fields(self.service))
+        finally:
+            self._costing = False
+
+    def _validate(self, value, validators=None):
+        self._run_validation(value, validators)
+        if value is None:
+            return None
+        schema = self.service._get_schema()
+        self._check_keys(schema, value)
+        try:
+            return schema.validate(value)
+        except AggregateValidationError as ex:
+            errors = list(ex.errors.values())
+            for error in errors:
+                error._prepend(self.name)
+            raise AggregateValidationError(errors, ex.truncated) from None
+        except ValidationError as ex:
+            ex._prepend(self.name)
+            raise
+
+    def _collect(self, value, validators, errors, max_errors):
+        try:
+            self._run_validation(value, validators)
+            if value is None:
+                return None
+            schema = self.service._get_schema()
+            self._check_keys(schema, value)
+        except ValidationError as ex:
+            errors.append(ex)
+            return None
+        values = {}
+        count = len(errors)
+        for name, field, field_validators in schema.chains:
+            if len(errors) - count >= max_errors:
+                break
+            item_value = value.get(name, Field.NULL)
+            if item_value is Field.NULL:
+                item_value = field.options['default']
+            field_errors = []
+            values[name] = field._collect(item_value, field_validators, field_errors, max_errors - len(errors) + count)
+            for ex in field_errors:
+                ex._prepend(self.name)
+                errors.append(ex)
+        return values
+
+    def _check_keys(self, schema, value):
+        if schema.names.issuperset(value):
+            return
+        for key in value:
+            if key not in schema.names:
+                ex = ValidationError(key, code='unknown')
+                ex._prepend(self.name)
+                raise ex
 
 
 class EmailField(Field):
     """Field which takes an email `str`.
-    What constitutes an email is very lax and it only checks for presence of '@' and domain.
+    What constitutes an email is very lax by default and it only checks for presence of '@' and domain,
+    declare it with `strict=True` for a subset of RFC 5322.
     There is no fool-proof way to confirm a valid email unless an email is sent at that address.
     """
-    def __init__(self, **options):
-        super().__init__(**options)
+    COST = 4
+
+    def __init__(self, strict=False, idna=False, domain_cache_size=1024, **options):
+        """
+        Args:
+            strict (bool, optional): If True, the address should match `STRICT_EMAIL_PATTERN`, a subset of RFC 5322,
+            instead of the lax `EMAIL_PATTERN`. Defaults to False.
+            idna (bool, optional): If True, the domain is normalized to its lowercase ASCII form with IDNA,
+            like `user@bücher.de` to `user@xn--bcher-kva.de`, before validation and the normalized address is stored.
+            An address whose domain IDNA can't encode, like an empty or too long label, is rejected.
+            Implies `coerce=True`. Defaults to False.
+            domain_cache_size (int, optional): Number of recently seen domains whose normalization and validation
+            is cached by `validate_many()` and IDNA normalization. Defaults to 1024.
+        """
+        if idna:
+            options['coerce'] = True
+        super().__init__(strict=strict, idna=idna, **options)
+        self._match, self._match_local, self._match_domain = (pattern.fullmatch for pattern in _EMAIL_PATTERNS[strict])
+        self._domains = lru_cache(maxsize=domain_cache_size)(self._lookup_domain)
+
+    def _lookup_domain(self, domain):
+        """Returns the normalized form of `domain`, or None if it can't be normalized, and whether it is valid.
+        """
+        if self.options['idna']:
+            try:
+                domain = domain.encode('idna').decode('ascii').lower()
+            except UnicodeError:
+                return None, False
+        return domain, self._match_domain(domain) is not None
+
+    def coerce(self, value):
+        if isinstance(value, str):
+            local, sep, domain = value.rpartition('@')
+            if sep:
+                domain = self._domains(domain)[0]
+                if domain is None:
+                    raise ValidationError(self.name, code='email')
+                return local + '@' + domain
+        return value
 
     def default_validator(self, value):
         if not isinstance(value, str):
-            raise ValidationError(self.name, 'Not of str type')
-        error = False
-        try:
-            if not re.fullmatch(r'[^@]+@[^@]+\.[^@]+', value):
-                error = True
-        except TypeError:
-            error = True
-        if error:
-            raise ValidationError(self.name, 'Not a valid email')
+            raise ValidationError(self.name, code='type', params={'type': 'str'})
+        if self._match(value) is None:
+            raise ValidationError(self.name, code='email')
+
+    def validate_many(self, values):
+        """Checks the format of many addresses in one pass, like `default_validator()` and IDNA normalization do.
+
+        In `strict` and `idna` modes domains are normalized and validated once and cached, so repeated domains only
+        cost a dictionary lookup. Validators given to the field are not applied.
+
+        Args:
+            values (iterable): The addresses to check.
+
+        Returns:
+            list: For each value, in order, the address, normalized when the field is declared with `idna=True`,
+            or None if the value is not a valid address.
+        """
+        idna = self.options['idna']
+        strict = self.options['strict']
+        if not idna and not strict:
+            match = self._match
+            return [value if isinstance(value, str) and match(value) is not None else None for value in values]
+        match_local = self._match_local
+        domains = self._domains
+        results = []
+        append = results.append
+        for value in values:
+            if isinstance(value, str):
+                local, sep, domain = value.rpartition('@')
+                if sep and match_local(local) is not None:
+                    domain, valid = domains(domain)
+                    if valid and (not strict or len(local) <= 64 and len(local) + len(domain) < 254):
+                        append(local + '@' + domain if idna else value)
+                        continue
+            append(None)
+        return results
 
 
 class ListField(Field):
@@ -225,10 +614,11 @@ class ListField(Field):
             [[['a', 'b'], ['c', 'd']], [['e'], ['f', 'g']]]
 
         Valid input values should either be of `list` or `tuple` type.
+        Items are validated in place by `item` itself, which is named `''` so that errors are reported with paths like `name[0][1]`.
 
         Args:
             item (Field): An instance of a `Field` which this `list` will hold.
-            is_root (bool, optional): This value should not be tampered with unless you exactly know what you are doing.
+            is_root (bool, optional): Unused, kept for backward compatibility.
             min_length (int, optional): If given, the length of the provided `list` should be greater than this.
             max_length (int, optional): If given, the length of the provided `list` should be less than this.
         
@@ -238,27 +628,49 @@ class ListField(Field):
         if not isinstance(item, Field):
             raise FireServiceError('ListField needs a Field type as contained item type')
         super().__init__(min_length=min_length, max_length=max_length, **options)
+        self._length = _bounds_validator(validators.length(min_length=min_length, max_length=max_length))
         self.item = item
+        self.item.__set_name__(self, '')
         self.is_root = is_root
 
-    def _init_value(self, instance, input_value):
-        if input_value == Field.NULL:
-            input_value = self.options['default']
-
-        internal_name = '_' + str(id(instance)) + '_' + self.name
-        self._run_validation(input_value)
-        set_value = None
-        if input_value is not None:
-            set_value = []
-            for i, v in enumerate(input_value):
-                if isinstance(self.item, ListField):
-                    self._init_item_field(i, internal_name, v, self.item.item, is_root=False, **self.item.options)
-                else:
-                    self._init_item_field(i, internal_name, v, **self.item.options)
-                set_value.append(self.__dict__[internal_name])
-                del self.__dict__[internal_name]
-
-        setattr(instance, self.name, set_value)
+    def _content_cost(self, length):
+        return self._expected_length(length) * self.item.cost()
+
+    def _validate(self, value, validators=None):
+        self._run_validation(value, validators)
+        if value is None:
+            return None
+        validate_item = self.item._validate
+        set_value = []
+        append = set_value.append
+        for idx, item_value in enumerate(value):
+            try:
+                append(validate_item(item_value))
+            except ValidationError as ex:
+                ex._prepend(self.name, idx)
+                raise
+        return set_value
+
+    def _collect(self, value, validators, errors, max_errors):
+        try:
+            self._run_validation(value, validators)
+        except ValidationError as ex:
+            errors.append(ex)
+            return None
+        if value is None:
+            return None
+        collect_item = self.item._collect
+        set_value = []
+        count = len(errors)
+        for idx, item_value in enumerate(value):
+            if len(errors) - count >= max_errors:
+                break
+            item_errors = []
+            set_value.append(collect_item(item_value, None, item_errors, max_errors - len(errors) + count))
+            for ex in item_errors:
+                ex._prepend(self.name, idx)
+                errors.append(ex)
+        return set_value
 
     @staticmethod
     def _is_valid_type(value):
@@ -266,21 +678,111 @@ class ListField(Field):
             return True
         return False
 
-    def _init_item_field(self, idx, name, value, *args, **kwargs):
-        f = type(self.item)(*args, **kwargs)
-        f.__set_name__(self, name)
-        try:
-            f._init_value(self, value)
-        except ValidationError as ex:
-            field = '' if ex.field.startswith('_') else ex.field
-            if not self.is_root:
-                raise ValidationError('[%s]%s' % (idx, field), ex.error)
-            field = '%s[%s]%s' % (self.name, idx, field)
-            raise ValidationError(field, ex.error)
-
     def default_validator(self, value):
         valid_type = isinstance(value, list) or isinstance(value, tuple)
         if not valid_type:
-            raise ValidationError(self.name, 'Not of list or tuple type')
-        validator = validators.length(min_length=self.options.get('min_length'), max_length=self.options.get('max_length'))
-        validator(self.name, value)
+            raise ValidationError(self.name, code='type', params={'type': 'list or tuple'})
+        if self._length is not None:
+            self._length(self.name, value)
+
+
+class StreamListField(Field):
+    """Field which takes any iterable, like a generator or a file, whose items are validated lazily as `fire()` consumes them.
+
+    Memory stays constant in the number of items: the field value is a `ValidatedStream` which can be iterated once.
+    A `ValidationError` for an invalid item, or for a length out of bounds, is raised by the iteration itself, labelled
+    with the failing index like `name[41]`.
+    """
+    def __init__(self, item, min_length=None, max_length=None, json_lines=False, **options):
+        """
+        Args:
+            item (Field): An instance of a `Field` which validates every item.
+            min_length (int, optional): If given, the iteration should yield at least this many items.
+            Checked once the input is exhausted.
+            max_length (int, optional): If given, the iteration should yield at most this many items.
+            Checked as soon as an extra item is read.
+            json_lines (bool, optional): If True, every item is a line of JSON, like the lines of a file
+            in JSON Lines format, which is decoded before validation. Blank lines are skipped. Defaults to False.
+
+        Raises:
+            FireServiceError: Raised when `item` is not of `Field` type.
+        """
+        if not isinstance(item, Field):
+            raise FireServiceError('StreamListField needs a Field type as contained item type')
+        super().__init__(min_length=min_length, max_length=max_length, json_lines=json_lines, **options)
+        self.item = item
+        self.item.__set_name__(self, '')
+
+    def _validate(self, value, validators=None):
+        self._run_validation(value, validators)
+        if value is None:
+            return None
+        return ValidatedStream(self, value)
+
+    def default_validator(self, value):
+        if isinstance(value, (str, bytes, bytearray, dict)) or not hasattr(value, '__iter__'):
+            raise ValidationError(self.name, code='type', params={'type': 'iterable'})
+
+
+class ValidatedStream:
+    """Iterator over the items of a `StreamListField` value, validating each item as it is read.
+    """
+    def __init__(self, field, iterable):
+        """
+        Args:
+            field (StreamListField): The field declaring the item type and length bounds.
+            iterable (iterable): The provided value.
+        """
+        self._field = field
+        self._items = iter(iterable)
+        self._validate_item = field.item._validate
+        self._min_length = field.options.get('min_length')
+        self._max_length = field.options.get('max_length')
+        self._json_lines = field.options.get('json_lines')
+        self._done = False
+        self.count = 0
+        """The number of items read so far.
+        """
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        try:
+            value = self._next_value()
+        except StopIteration:
+            self._done = True
+            if self._min_length is not None and self.count < self._min_length:
+                raise ValidationError(self._field.name, code='min_length',
+                                      params={'length': self.count, 'min_length': self._min_length})
+            raise
+        if self._max_length is not None and self.count >= self._max_length:
+            self._done = True
+            raise ValidationError(self._field.name, code='max_length',
+                                  params={'length': self.count + 1, 'max_length': self._max_length})
+        try:
+            if self._json_lines:
+                value = self._decode(value)
+            value = self._validate_item(value)
+        except ValidationError as ex:
+            ex._prepend(self._field.name, self.count)
+            raise
+        finally:
+            self.count += 1
+        return value
+
+    def _next_value(self):
+        value = next(self._items)
+        if self._json_lines:
+            while not value.strip():
+                value = next(self._items)
+        return value
+
+    @staticmethod
+    def _decode(line):
+        try:
+            return jsonbackend.loads(line)
+        except ValueError:
+            raise ValidationError('', code='parse', params={'type': 'JSON'}) from None
@@ -0,0 +1,315 @@
+"""Timing instrumentation of `FireService.call()` and `FireService.acall()`.
+
+Register an `Observer` to receive a `CallRecord` with the duration of each phase of every call: input validation,
+`pre_fire()`, `fire()` and `post_fire()`, measured with the monotonic `time.perf_counter()`. While no observer is
+registered calls take their regular path, the only cost is checking that `observers` is empty.
+
+```
+metrics = MetricsAggregator()
+instrumentation.register(metrics)
+...
+print(metrics.report()[Crawler]['phases']['fire']['p99'])
+```
+"""
+import math
+import inspect
+from time import perf_counter
+from threading import Lock
+from collections import Counter
+from fireservice.fields import Field
+from fireservice.exceptions import FireServiceError, SkipError
+
+
+PHASES = ('validate', 'pre_fire', 'fire', 'post_fire')
+"""Names of the phases of a call, in execution order.
+"""
+
+observers = []
+"""The registered observers, notified in registration order.
+"""
+
+
+def register(observer):
+    """Starts notifying `observer` of all service calls.
+
+    Args:
+        observer (Observer): The observer to add.
+    """
+    if observer not in observers:
+        observers.append(observer)
+
+
+def unregister(observer):
+    """Stops notifying `observer`, calls go back to the uninstrumented path when no observer is left.
+
+    Args:
+        observer (Observer): The observer to remove.
+    """
+    if observer in observers:
+        observers.remove(observer)
+
+
+class CallRecord:
+    """Timings and outcome of one service call.
+    """
+    __slots__ = ('service_class', 'phases', 'fields', 'outcome', 'exception')
+
+    def __init__(self, service_class):
+        self.service_class = service_class
+        """The `FireService` class which was called.
+        """
+        self.phases = {}
+        """Maps the name of each phase which ran, see `PHASES`, to its duration in seconds.
+        """
+        self.fields = None
+        """Maps the name of each validated field to its validation time in seconds, when an observer asked for it.
+        """
+        self.outcome = 'ok'
+        """`ok`, `invalid` when the input was rejected, `skipped` when `pre_fire()` raised `SkipError`
+        or `error` when validation or a callback raised another exception.
+        """
+        self.exception = None
+        """The type of the exception which ended the call, if any.
+        """
+
+
+class Observer:
+    """Base class of the observers of service calls.
+    """
+    field_timings = False
+    """If True, fields are validated one by one to measure the time of each, which bypasses compiled
+    validation and the validation cache and so slows calls down. Lazy fields are still validated when read,
+    and not timed.
+    """
+
+    def on_call(self, record):
+        """Called once a call finished, successfully or not.
+
+        Args:
+            record (CallRecord): The timings and outcome of the call.
+        """
+        pass
+
+
+def _validate(service, input, record):
+    schema = type(service)._get_schema()
+    if schema.max_errors is None and schema.cache is None and any(observer.field_timings for observer in observers):
+        record.fields = _validate_fields(service, schema, input)
+    else:
+        service._process_input(input)
+
+
+def _validate_fields(service, schema, input):
+    schema.check_keys(input)
+    if schema.required:
+        schema.check_required(input)
+    timings = {}
+    values = {}
+    for name, field, validators in schema.ordered:
+        if field.options.get('lazy'):
+            field._init_value(service, input.get(name, Field.NULL), validators)
+            continue
+        start = perf_counter()
+        value = input.get(name, Field.NULL)
+        if value is Field.NULL:
+            value = field.options['default']
+        values[name] = field._validate(value, validators)
+        timings[name] = perf_counter() - start
+    service._assign_values(values)
+    return timings
+
+
+class _Timer:
+    """Runs the phases of one call, recording their duration and how the call ended in a `CallRecord`.
+    `FireService._execute()` and `_aexecute()` call it with each phase instead of calling the phase directly.
+    """
+    def __init__(self, record):
+        self.record = record
+
+    def __call__(self, phase, function, *args):
+        start = perf_counter()
+        try:
+            return function(*args)
+        except BaseException as ex:
+            self._fail(phase, ex)
+            raise
+        finally:
+            self.record.phases[phase] = perf_counter() - start
+
+    async def run_async(self, phase, function, *args):
+        """Like calling the timer, awaiting the value of `function` if it is awaitable.
+        """
+        start = perf_counter()
+        try:
+            value = function(*args)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+        except BaseException as ex:
+            self._fail(phase, ex)
+            raise
+        finally:
+            self.record.phases[phase] = perf_counter() - start
+
+    def _fail(self, phase, ex):
+        if phase == 'validate' and isinstance(ex, FireServiceError):
+            self.record.outcome = 'invalid'
+        elif phase == 'pre_fire' and isinstance(ex, SkipError):
+            self.record.outcome = 'skipped'
+        else:
+            self.record.outcome = 'error'
+        self.record.exception = type(ex)
+
+
+def _notify(record):
+    for observer in list(observers):
+        observer.on_call(record)
+
+
+def observe_call(service, input, kwargs):
+    """Runs `service.call(input, **kwargs)` measuring each phase and notifies the observers.
+    """
+    record = CallRecord(type(service))
+    timer = _Timer(record)
+    try:
+        timer('validate', _validate, service, input, record)
+        return service._execute(kwargs, timer)
+    finally:
+        _notify(record)
+
+
+async def observe_acall(service, input, kwargs):
+    """Asynchronous version of `observe_call()` for `service.acall(input, **kwargs)`.
+    """
+    record = CallRecord(type(service))
+    timer = _Timer(record)
+    try:
+        timer('validate', _validate, service, input, record)
+        return await service._aexecute(kwargs, timer.run_async)
+    finally:
+        _notify(record)
+
+
+class Histogram:
+    """Histogram of durations in logarithmic buckets, so memory doesn't grow with the number of samples.
+
+    Percentiles are accurate within `precision` of the true value.
+    """
+    def __init__(self, precision=0.01):
+        """
+        Args:
+            precision (float, optional): Relative width of a bucket. Defaults to 1%.
+        """
+        self._log_base = math.log1p(precision)
+        self._buckets = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, seconds):
+        """Counts a duration.
+        """
+        self._buckets[math.floor(math.log(seconds) / self._log_base) if seconds > 0 else None] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+        Args:
+            percent (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The duration below which `percent` of the durations fall, None when empty.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = self._buckets.get(None, 0)
+        if seen >= rank:
+            return 0.0
+        for index in sorted(key for key in self._buckets if key is not None):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(max(math.exp((index + 1) * self._log_base), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Returns:
+            dict: The `count`, `mean`, `min`, `max`, `p50`, `p95` and `p99` of the durations, in seconds.
+        """
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class MetricsAggregator(Observer):
+    """An in-memory `Observer` aggregating the calls of every service class: counts per outcome and
+    exception type, and duration histograms per phase and, with `field_timings`, per field.
+    """
+    def __init__(self, field_timings=False, precision=0.01):
+        """
+        Args:
+            field_timings (bool, optional): If True, also aggregates the validation time of each field. Defaults to False.
+            precision (float, optional): Relative precision of the percentiles. Defaults to 1%.
+        """
+        self.field_timings = field_timings
+        self._precision = precision
+        self._services = {}
+        self._lock = Lock()
+
+    def on_call(self, record):
+        with self._lock:
+            metrics = self._services.get(record.service_class)
+            if metrics is None:
+                metrics = self._services[record.service_class] = {
+                    'calls': 0, 'outcomes': Counter(), 'exceptions': Counter(), 'phases': {}, 'fields': {}}
+            metrics['calls'] += 1
+            metrics['outcomes'][record.outcome] += 1
+            if record.exception is not None:
+                metrics['exceptions'][record.exception.__name__] += 1
+            self._add(metrics['phases'], record.phases)
+            if record.fields:
+                self._add(metrics['fields'], record.fields)
+
+    def _add(self, histograms, durations):
+        for name, seconds in durations.items():
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = Histogram(self._precision)
+            histogram.add(seconds)
+
+    def report(self):
+        """
+        Returns:
+            dict: Maps each called service class to a dict of its `calls` count, its `outcomes` and `exceptions`
+            counts, and the `Histogram.summary()` of each of its `phases` and `fields`.
+        """
+        with self._lock:
+            return {
+                service_class: {
+                    'calls': metrics['calls'],
+                    'outcomes': dict(metrics['outcomes']),
+                    'exceptions': dict(metrics['exceptions']),
+                    'phases': {name: metrics['phases'][name].summary() for name in PHASES if name in metrics['phases']},
+                    'fields': {name: histogram.summary() for name, histogram in metrics['fields'].items()},
+                }
+                for service_class, metrics in self._services.items()
+            }
+
+    def reset(self):
+        """Drops all aggregated calls.
+        """
+        with self._lock:
+            self._services.clear()
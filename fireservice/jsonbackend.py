@@ -0,0 +1,31 @@
+"""JSON decoding used by `FireService.call_json()`.
+
+The fastest installed backend is used: `orjson`, then `ujson`, falling back to the standard library `json`.
+"""
+try:
+    import orjson as backend
+except ImportError:
+    try:
+        import ujson as backend
+    except ImportError:
+        import json as backend
+
+
+name = backend.__name__
+"""Name of the backend in use.
+"""
+
+
+def loads(raw):
+    """Decodes a JSON document.
+
+    Args:
+        raw (bytes or str): The JSON document.
+
+    Returns:
+        object: The decoded value.
+
+    Raises:
+        ValueError: Raised when `raw` is not valid JSON.
+    """
+    return backend.loads(raw)
@@ -0,0 +1,75 @@
+import queue
+from contextlib import contextmanager
+from fireservice.exceptions import FireServiceError
+
+
+class ServicePool:
+    """A fixed set of preallocated instances of a `FireService` class which are reused across calls.
+
+    Use it for services whose `__init__` holds heavy per-instance setup (clients, compiled templates) to avoid
+    an allocation and setup per call. Between two calls the field values and modification flags of an instance
+    are reset, other attributes set by the service are kept.
+
+    ```
+    pool = Render.pool(size=8)
+    html = pool.call({'template': 'index.html'})
+    ```
+
+    The pool is safe to use from many threads, a call waits for an idle instance when all are in use.
+    """
+    def __init__(self, service_class, size):
+        """
+        Args:
+            service_class (type): The `FireService` class to instantiate.
+            size (int): The number of instances created upfront.
+        """
+        if size < 1:
+            raise ValueError('size should be at least 1')
+        self.service_class = service_class
+        self.size = size
+        """The number of instances in the pool.
+        """
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(service_class())
+
+    @property
+    def idle(self):
+        """The number of instances not in use.
+        """
+        return self._idle.qsize()
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """Hands out an idle instance, and resets and returns it to the pool when the block exits.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an idle instance. Defaults to waiting forever.
+
+        Raises:
+            FireServiceError: Raised when no instance became idle within `timeout`.
+        """
+        try:
+            service = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise FireServiceError('No idle %s in pool after %s seconds' % (self.service_class.__name__, timeout))
+        try:
+            yield service
+        finally:
+            service._reset()
+            self._idle.put(service)
+
+    def call(self, input, timeout=None, **kwargs):
+        """Calls `call()` of an idle instance, which goes back to the pool after `post_fire()`.
+
+        Args:
+            input (dict): Dictionary of input values corresponding to `Field` instances in `FireService` class.
+            timeout (float, optional): Seconds to wait for an idle instance. Defaults to waiting forever.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method.
+
+        Returns:
+            object: Return value of `fire()` method.
+        """
+        with self.acquire(timeout) as service:
+            return service.call(input, **kwargs)
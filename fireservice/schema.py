@@ -0,0 +1,228 @@
+from fireservice.fields import Field
+from fireservice.cache import LRUCache, fingerprint, copy_value
+from fireservice.codegen import compile_process_input, compile_validate
+from fireservice.exceptions import ValidationError, UnknownParameterError, AggregateValidationError, ModificationError
+
+
+VALIDATION_ORDERS = ('cost', 'declaration')
+"""Accepted `validation_order` values: cheapest fields first, or declaration order.
+"""
+
+
+class Schema:
+    """Compiled input schema of a `FireService` class.
+
+    A schema is built once per class, on its first call, and cached on the class until a field is added,
+    replaced or removed. It holds everything `_process_input` needs so a call does a single pass over the
+    declared fields with O(1) checks for unknown parameters.
+    """
+    def __init__(self, fields, max_errors=None, setters=None, cache=None, order='cost'):
+        """
+        Args:
+            fields (list): Ordered `(name, field)` pairs of the `FireService` class.
+            max_errors (int, optional): If given, all fields are validated and up to this many errors are raised
+            together in an `AggregateValidationError`. Defaults to raising the first error.
+            setters (dict, optional): Maps names of fields declared with `slots=True` to functions
+            `setter(instance, value)` storing a value directly in their slot. Other fields are assigned through the field.
+            cache (LRUCache, optional): If given, the validated values of inputs are memoized in this cache, keyed by
+            the `fingerprint()` of the input, so a repeated input skips validation. Values which can't be copied, like
+            the one-shot iterator of a `StreamListField`, are never memoized.
+            order (str, optional): `cost` to check the presence of required fields before validating any field,
+            then validate fields from the cheapest to the most expensive by `Field.cost()`, so an invalid input is
+            rejected with little work. `declaration` to validate fields in declaration order. Fields are assigned in
+            validation order, while `validate()` returns values in declaration order. Collected errors are always
+            validated in declaration order. Defaults to `cost`.
+        """
+        self.fields = tuple(fields)
+        """Ordered `(name, field)` pairs.
+        """
+        self.names = frozenset(name for name, _ in self.fields)
+        """Names of all declared fields, that is, the accepted input keys.
+        """
+        self.chains = tuple((name, field, field._validators) for name, field in self.fields)
+        """Ordered `(name, field, validators)` triples with the user validators of each field prebound,
+        flattened and without no-op validators.
+        """
+        self.max_errors = max_errors
+        """Maximum number of collected errors, None when the first error is raised.
+        """
+        cost_order = order == 'cost' and max_errors is None
+        self.ordered = tuple(sorted(self.chains, key=lambda chain: chain[1].cost())) if cost_order else self.chains
+        """The `chains` in validation order.
+        """
+        self.reordered = self.ordered != self.chains
+        """True when fields are not validated in declaration order.
+        """
+        self.required = tuple(name for name, field, validators in self.ordered
+                              if cost_order and self._fails_when_missing(field, validators))
+        """Names of the fields, in validation order, which are checked for presence before any field is validated.
+        """
+        self._required_names = frozenset(self.required)
+        self.lazy = tuple(name for name, field in self.fields if field.options.get('lazy'))
+        """Names of the fields declared with `lazy=True`.
+        """
+        self.setters = setters or {}
+        """Functions storing the value of slotted fields in their slot.
+        """
+        self.slotted = bool(self.fields) and len(self.setters) == len(self.fields)
+        """True when every field is stored in a slot.
+        """
+        self.source = None
+        """Source of the generated `process` and `validate` functions when the schema is compiled, otherwise None.
+        """
+        self.cache = cache
+        """The `LRUCache` of validated values, None when validation is not memoized.
+        """
+        if cache is not None:
+            self._use_cache()
+
+    def compile(self, qualname):
+        """Replaces the generic `process` and `validate` with functions generated for this schema.
+
+        Args:
+            qualname (str): Qualified name of the `FireService` class.
+        """
+        self.process, process_source = compile_process_input(self, qualname)
+        self.validate, validate_source = compile_validate(self, qualname)
+        self.source = process_source + '\n\n' + validate_source
+        if self.cache is not None:
+            self._use_cache()
+
+    def _use_cache(self):
+        self._validate_input = self.validate
+        self.validate = self._validate_cached
+        self.process = self._process_cached
+
+    def _validate_cached(self, input):
+        try:
+            key = fingerprint(input)
+            values = self.cache.get(key)
+        except TypeError:
+            return self._validate_input(input)
+        if values is LRUCache.MISSING:
+            values = self._validate_input(input)
+            try:
+                fingerprint(values)
+            except TypeError:
+                return values
+            self.cache.set(key, copy_value(values))
+            return values
+        return copy_value(values)
+
+    def _process_cached(self, instance, input):
+        for name, value in self._validate_cached(input).items():
+            setattr(instance, name, value)
+
+    def process(self, instance, input):
+        """Validates `input` and initializes the fields of `instance` with it.
+
+        Args:
+            instance (FireService): The service being called.
+            input (dict): Input values of the call.
+        """
+        if self.max_errors is not None:
+            for name, value in self.validate(input).items():
+                setattr(instance, name, value)
+            return
+        self.check_keys(input)
+        if self.required:
+            self.check_required(input)
+        if self.slotted:
+            if getattr(instance, '_frozen', False):
+                raise ModificationError('Attempt to change field: %s' % self.fields[0][0])
+            setters = self.setters
+            for name, field, validators in self.ordered:
+                value = input.get(name, Field.NULL)
+                if value is Field.NULL:
+                    value = field.options['default']
+                setters[name](instance, field._validate(value, validators))
+            return
+        for name, field, validators in self.ordered:
+            field._init_value(instance, input.get(name, Field.NULL), validators)
+
+    def validate(self, input):
+        """Validates `input` without initializing any instance.
+
+        Args:
+            input (dict): Input values of a `FireService` call.
+
+        Returns:
+            dict: The validated value of every declared field, in declaration order.
+
+        Raises:
+            UnknownParameterError: Raised when `input` contains a key which doesn't match any declared field.
+            ValidationError: Raised for the first invalid field, in validation order.
+            AggregateValidationError: Raised with all errors instead when the schema has `max_errors`.
+        """
+        self.check_keys(input)
+        if self.max_errors is not None:
+            return self._validate_all(input)
+        if self.required:
+            self.check_required(input)
+        values = {}
+        for name, field, validators in self.ordered:
+            value = input.get(name, Field.NULL)
+            if value is Field.NULL:
+                value = field.options['default']
+            values[name] = field._validate(value, validators)
+        if self.reordered:
+            return {name: values[name] for name, _ in self.fields}
+        return values
+
+    def _validate_all(self, input):
+        # One error past the cap is collected to tell a truncated report from one of exactly max_errors errors.
+        limit = self.max_errors + 1
+        values = {}
+        errors = []
+        for name, field, validators in self.chains:
+            if len(errors) >= limit:
+                break
+            value = input.get(name, Field.NULL)
+            if value is Field.NULL:
+                value = field.options['default']
+            count = len(errors)
+            value = field._collect(value, validators, errors, limit - count)
+            if len(errors) == count:
+                values[name] = value
+        if errors:
+            raise AggregateValidationError(errors[:self.max_errors], len(errors) > self.max_errors)
+        return values
+
+    def check_keys(self, input):
+        """Checks that every key of `input` belongs to a declared field.
+
+        Args:
+            input (dict): Input values of a `FireService` call.
+
+        Raises:
+            UnknownParameterError: Raised for the first key which doesn't match any declared field.
+        """
+        if self.names.issuperset(input):
+            return
+        for key in input:
+            if key not in self.names:
+                raise UnknownParameterError('Unknown parameter: %s provided' % key)
+
+    def check_required(self, input):
+        """Checks that `input` has a key for every field of `required`.
+
+        Args:
+            input (dict): Input values of a `FireService` call.
+
+        Raises:
+            ValidationError: Raised for the first missing field, in validation order.
+        """
+        if input.keys() >= self._required_names:
+            return
+        for name in self.required:
+            if name not in input:
+                raise ValidationError(name, code='required')
+
+    @staticmethod
+    def _fails_when_missing(field, validators):
+        """True when a missing value is rejected by the `required` validator of a field with the default `_init_value`.
+        """
+        return (field.options['default'] is None
+                and not field.options.get('lazy')
+                and type(field)._init_value is Field._init_value
+                and any(getattr(validator, 'kind', None) == 'required' for validator in validators))
@@ -1,8 +1,152 @@
+import abc
+import asyncio
+import inspect
+from threading import Lock
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from collections import namedtuple
 from fireservice.fields import Field
-from fireservice.exceptions import ValidationError, UnknownParameterError, SkipError
+from fireservice.schema import Schema, VALIDATION_ORDERS
+from fireservice.pool import ServicePool
+from fireservice.cache import LRUCache, ResultCache, fingerprint
+from fireservice import columnar, jsonbackend, instrumentation
+from fireservice.exceptions import FireServiceError, SkipError, ModificationError
 
 
-class FireService:
+_schema_lock = Lock()
+
+
+async def _maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def _fire_validated(service_class, values, kwargs):
+    service = service_class()
+    service._assign_values(values)
+    return service._execute(kwargs)
+
+
+def _map_in_process_pool(service_class, values, kwargs, chunksize):
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_fire_validated, repeat(service_class), values, repeat(kwargs), chunksize=chunksize)
+
+
+CallResult = namedtuple('CallResult', ['value', 'error'])
+CallResult.__doc__ = """Outcome of one call made by `FireService.call_many()`.
+
+`value` is the return value of `fire()` and `error` the exception raised by the call, otherwise None.
+"""
+
+
+def _slotted_setattr(self, name, value):
+    if getattr(self, '_frozen', False) and name in type(self)._get_schema().names:
+        raise ModificationError('Attempt to change field: %s' % name)
+    object.__setattr__(self, name, value)
+
+
+def _slotted_freeze(self):
+    object.__setattr__(self, '_frozen', True)
+
+
+def _slotted_reset(self):
+    schema = type(self)._get_schema()
+    for name in schema.setters:
+        if hasattr(self, name):
+            object.__delattr__(self, name)
+    values = getattr(self, '__dict__', None)
+    if values is not None:
+        for name in schema.names:
+            values.pop(name, None)
+        values.pop(Field._MOD_FLAG_KEY, None)
+    object.__setattr__(self, '_frozen', False)
+
+
+def _slotted_getstate(self):
+    slots = {}
+    for klass in type(self).__mro__:
+        for name in klass.__dict__.get('__slots__', ()):
+            if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                slots[name] = getattr(self, name)
+    return getattr(self, '__dict__', None), slots
+
+
+def _slotted_setstate(self, state):
+    values, slots = state
+    if values:
+        self.__dict__.update(values)
+    for name, value in slots.items():
+        object.__setattr__(self, name, value)
+
+
+class FireServiceMeta(abc.ABCMeta):
+    """Metaclass of `FireService`.
+
+    It keeps the cached input `Schema` of a class in sync when fields are added, replaced or removed after
+    the class has been created. It derives from `abc.ABCMeta`, so services can also subclass `abc.ABC`
+    and declare abstract methods.
+
+    Declaring a class with `slots=True` stores its field values in generated `__slots__` instead of an instance
+    `__dict__`, which makes instances smaller and field assignment cheaper. Instead of a flag per field, a single
+    `_frozen` flag is set once the input is processed, after which fields can't be modified. Only attributes declared
+    in the `__slots__` of the class body can be assigned besides fields, and reading a field before the service
+    is called raises `AttributeError`.
+
+    ```
+    class Crawler(FireService, slots=True):
+        __slots__ = ('client',)
+        user_id = IntegerField(min_value=1)
+    ```
+    """
+    def __new__(mcs, name, bases, namespace, slots=False, **kwargs):
+        fields = None
+        if slots:
+            fields = {key: value for key, value in namespace.items() if isinstance(value, Field)}
+            lazy = [key for key, value in fields.items() if value.options.get('lazy')]
+            if lazy:
+                raise FireServiceError('Lazy fields are not supported with slots=True: %s' % ', '.join(lazy))
+            namespace = {key: value for key, value in namespace.items() if key not in fields}
+            declared = namespace.get('__slots__', ())
+            declared = (declared,) if isinstance(declared, str) else tuple(declared)
+            frozen = () if any(hasattr(base, '_frozen') for base in bases) else ('_frozen',)
+            namespace['__slots__'] = declared + tuple(fields) + frozen
+            namespace['_slot_fields'] = fields
+            namespace['__setattr__'] = _slotted_setattr
+            namespace['_freeze'] = _slotted_freeze
+            namespace['_reset'] = _slotted_reset
+            namespace['__getstate__'] = _slotted_getstate
+            namespace['__setstate__'] = _slotted_setstate
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        if fields:
+            for field_name, field in fields.items():
+                field.__set_name__(cls, field_name)
+        return cls
+
+    def __setattr__(cls, name, value):
+        if isinstance(value, Field) and '_slot_fields' in cls.__dict__:
+            raise FireServiceError('Fields cannot be added to %s which is declared with slots=True' % cls.__name__)
+        is_field = isinstance(value, Field) or cls._declares_field(name)
+        if isinstance(value, Field):
+            value.__set_name__(cls, name)
+        super().__setattr__(name, value)
+        if is_field:
+            cls._invalidate_schema()
+
+    def __delattr__(cls, name):
+        is_field = cls._declares_field(name)
+        super().__delattr__(name)
+        if is_field:
+            cls._invalidate_schema()
+
+    def _declares_field(cls, name):
+        """True when `name` is a field of `cls` or of any of its bases, even if shadowed by another attribute.
+        """
+        return any(isinstance(klass.__dict__.get(name), Field) or name in klass.__dict__.get('_slot_fields', ())
+                   for klass in cls.__mro__)
+
+
+class FireService(metaclass=FireServiceMeta):
     """The main class which manages the execution of services. Users should subclass this class to make their execution managed.
     
     ```
@@ -33,7 +177,8 @@ class FireService:
         UnknownParameterError: Raised when `call()` is called with a parameter with no corresponding declared `Field`.
         NotImplementedError: Raised when an abstract method is not implemented. The `fire()` method should be implemented all subclasses.
     """
-    
+    __slots__ = ()
+
     def call(self, input, **kwargs):
         """This method should be called from outside to start the execution of service.
         It performs input validations based on defined instances of `Field` and starts execution.
@@ -49,36 +194,491 @@ class FireService:
         Raises:
             UnknownParameterError: Raised when `input` contains a key which doesn't match any declared `Field`.
             ValidationError: Raised when input validation based on definition of `Field` fails.
+            AggregateValidationError: Raised with all validation errors instead for classes declared with `collect_errors=True`.
         """
+        if instrumentation.observers:
+            return instrumentation.observe_call(self, input, kwargs)
         self._process_input(input)
+        return self._execute(kwargs)
+
+    def call_json(self, raw, **kwargs):
+        """Like `call()` but takes the input as a JSON object, decoded with the fastest installed JSON backend
+        (`orjson`, `ujson` or the standard library).
+
+        Declare fields with `coerce=True` to accept JSON representations of their values, like ISO-8601 strings
+        for `DateField` and `DateTimeField`, which are then parsed while validating.
+
+        ```
+        class Report(FireService):
+            day = DateField(coerce=True)
+
+        Report().call_json(b'{"day": "2019-12-04"}')
+        ```
+
+        Args:
+            raw (bytes or str): A JSON object of input values corresponding to `Field` instances in `FireService` class.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method.
+
+        Returns:
+            object: Return value of `fire()` method.
+
+        Raises:
+            ValueError: Raised when `raw` is not valid JSON.
+            FireServiceError: Raised when `raw` is not a JSON object.
+            UnknownParameterError: Raised when `raw` contains a key which doesn't match any declared `Field`.
+            ValidationError: Raised when input validation based on definition of `Field` fails.
+        """
+        input = jsonbackend.loads(raw)
+        if not isinstance(input, dict):
+            raise FireServiceError('JSON input should be an object')
+        return self.call(input, **kwargs)
+
+    def _execute(self, kwargs, run=None):
+        """Runs `pre_fire()`, `fire()` and `post_fire()` on the validated fields.
+
+        Args:
+            kwargs (dict): Keyword arguments of `fire()`.
+            run (callable, optional): If given, each phase is called as `run(phase, function, *args)`, like the
+            timer of `instrumentation.observe_call()`, instead of `function(*args)`.
+        """
+        call_fire = True
+        exc = None
+        return_value = None
+        try:
+            if run is None:
+                self.pre_fire()
+            else:
+                run('pre_fire', self.pre_fire)
+        except SkipError as ex:
+            call_fire = False
+            exc = ex
+        if call_fire:
+            return_value = self._fire(kwargs) if run is None else run('fire', self._fire, kwargs)
+        if run is None:
+            self.post_fire(call_fire, exc)
+        else:
+            run('post_fire', self.post_fire, call_fire, exc)
+        return return_value
+
+    async def _aexecute(self, kwargs, run=None):
+        """Asynchronous version of `_execute()`, where `run(phase, function, *args)` returns an awaitable
+        and `pre_fire()`, `fire()` and `post_fire()` are awaited if they are coroutine functions.
+        """
         call_fire = True
         exc = None
         return_value = None
         try:
-            self.pre_fire()
+            if run is None:
+                await _maybe_await(self.pre_fire())
+            else:
+                await run('pre_fire', self.pre_fire)
         except SkipError as ex:
             call_fire = False
             exc = ex
         if call_fire:
-            return_value = self.fire(**kwargs)
-        self.post_fire(call_fire, exc)
+            return_value = await (self._afire(kwargs) if run is None else run('fire', self._afire, kwargs))
+        if run is None:
+            await _maybe_await(self.post_fire(call_fire, exc))
+        else:
+            await run('post_fire', self.post_fire, call_fire, exc)
         return return_value
 
+    def _fire(self, kwargs):
+        results = type(self)._results
+        key = None if results is None else self._result_key(kwargs)
+        if key is None:
+            return self.fire(**kwargs)
+        return results.call(key, lambda: self.fire(**kwargs))
+
+    async def _afire(self, kwargs):
+        results = type(self)._results
+        key = None if results is None else self._result_key(kwargs)
+        if key is None:
+            return await _maybe_await(self.fire(**kwargs))
+        return await results.acall(key, lambda: _maybe_await(self.fire(**kwargs)))
+
+    def _result_key(self, kwargs):
+        schema = type(self)._get_schema()
+        if schema.lazy:
+            return None
+        try:
+            key = fingerprint((tuple([getattr(self, name) for name, _ in schema.fields]), kwargs))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @classmethod
+    def submit(cls, input, executor, **kwargs):
+        """Validates `input` and schedules the execution of the service on `executor`.
+
+        Validation happens in the calling process. Only the validated field values are sent to the executor, where
+        a new instance of the service is initialized with them, without validating again, and executed like in `call()`.
+        With a `concurrent.futures.ProcessPoolExecutor` this spreads CPU-bound `fire()` methods over all cores.
+        The service class should be importable by the worker processes, that is, defined at module level.
+
+        ```
+        with ProcessPoolExecutor() as executor:
+            future = Render.submit({'template': 'index.html'}, executor)
+            print(future.result())
+        ```
+
+        Args:
+            input (dict): Dictionary of input values corresponding to `Field` instances in `FireService` class.
+            executor (concurrent.futures.Executor): The executor running the service.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method, they should be picklable.
+
+        Returns:
+            concurrent.futures.Future: Future of the return value of `fire()` method.
+
+        Raises:
+            UnknownParameterError: Raised when `input` contains a key which doesn't match any declared `Field`.
+            ValidationError: Raised when input validation based on definition of `Field` fails.
+        """
+        values = cls._get_schema().validate(input)
+        return executor.submit(_fire_validated, cls, values, kwargs)
+
+    @classmethod
+    def map(cls, inputs, executor=None, chunksize=1, **kwargs):
+        """Like `submit()` for each input of `inputs`, returning the results in order.
+
+        Args:
+            inputs (iterable): Input dictionaries, validated in the calling process.
+            executor (concurrent.futures.Executor, optional): The executor running the services.
+            Defaults to a `ProcessPoolExecutor` with a worker per core, shut down once all results are returned.
+            chunksize (int, optional): Number of inputs sent to a worker process at once. Defaults to 1.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method of every call, they should be picklable.
+
+        Returns:
+            iterator: Return values of `fire()` method, in the order of `inputs`.
+            The error of a call is raised when its result is reached.
+
+        Raises:
+            UnknownParameterError: Raised when an input contains a key which doesn't match any declared `Field`.
+            ValidationError: Raised when validation of an input fails.
+        """
+        schema = cls._get_schema()
+        values = [schema.validate(input) for input in inputs]
+        if executor is not None:
+            return executor.map(_fire_validated, repeat(cls), values, repeat(kwargs), chunksize=chunksize)
+        return _map_in_process_pool(cls, values, kwargs, chunksize)
+
+    @classmethod
+    def call_many(cls, inputs, fail_fast=True, **kwargs):
+        """Calls a new instance of the service for each input of `inputs`.
+
+        Results are yielded in order as they are produced, so a large or unbounded iterable of inputs is processed
+        with flat memory usage. The compiled schema of the class is shared by all calls.
+
+        ```
+        for result in Crawler.call_many(({'user_id': 1, 'page_name': page} for page in pages), fail_fast=False):
+            if result.error:
+                print(result.error)
+        ```
+
+        Args:
+            inputs (iterable): Input dictionaries, each is passed to `call()` of its own service instance.
+            fail_fast (bool, optional): If True, the first error stops the batch and is raised.
+            Otherwise errors are collected in the yielded results and the batch continues. Defaults to True.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method of every call.
+
+        Yields:
+            CallResult: The return value or error of each call, in the order of `inputs`.
+
+        Raises:
+            UnknownParameterError: Raised in `fail_fast` mode when an input contains an unknown key.
+            ValidationError: Raised in `fail_fast` mode when validation of an input fails.
+        """
+        cls._get_schema()
+        for input in inputs:
+            if fail_fast:
+                yield CallResult(cls().call(input, **kwargs), None)
+                continue
+            try:
+                value = cls().call(input, **kwargs)
+            except Exception as ex:
+                yield CallResult(None, ex)
+            else:
+                yield CallResult(value, None)
+
+    async def acall(self, input, **kwargs):
+        """Asynchronous version of `call()`.
+
+        `pre_fire()`, `fire()` and `post_fire()` may be coroutine functions, in which case they are awaited,
+        or regular methods. Raising `SkipError` in `pre_fire()` skips `fire()` just like in `call()`.
+
+        Args:
+            input (dict): Dictionary of input values corresponding to `Field` instances in `FireService` class.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method.
+
+        Returns:
+            object: Return value of `fire()` method, awaited if it is a coroutine.
+
+        Raises:
+            UnknownParameterError: Raised when `input` contains a key which doesn't match any declared `Field`.
+            ValidationError: Raised when input validation based on definition of `Field` fails.
+        """
+        if instrumentation.observers:
+            return await instrumentation.observe_acall(self, input, kwargs)
+        self._process_input(input)
+        return await self._aexecute(kwargs)
+
+    @classmethod
+    async def acall_many(cls, inputs, concurrency=100, fail_fast=True, **kwargs):
+        """Asynchronous version of `call_many()` which runs up to `concurrency` calls at once.
+
+        ```
+        results = await Crawler.acall_many(inputs, concurrency=500, fail_fast=False)
+        ```
+
+        Args:
+            inputs (iterable): Input dictionaries, each is passed to `acall()` of its own service instance.
+            concurrency (int, optional): Maximum number of calls in flight. Defaults to 100.
+            fail_fast (bool, optional): If True, the first error cancels the calls in flight and is raised.
+            Otherwise errors are collected in the results and the batch continues. Defaults to True.
+
+        Use keyword arguments to pass some extra parameters to *fire()* method of every call.
+
+        Returns:
+            list: A `CallResult` for each input, in the order of `inputs`.
+
+        Raises:
+            UnknownParameterError: Raised in `fail_fast` mode when an input contains an unknown key.
+            ValidationError: Raised in `fail_fast` mode when validation of an input fails.
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency should be at least 1')
+        cls._get_schema()
+        pending = enumerate(inputs)
+        results = {}
+
+        async def worker():
+            for idx, input in pending:
+                if fail_fast:
+                    results[idx] = CallResult(await cls().acall(input, **kwargs), None)
+                    continue
+                try:
+                    results[idx] = CallResult(await cls().acall(input, **kwargs), None)
+                except Exception as ex:
+                    results[idx] = CallResult(None, ex)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        return [results[idx] for idx in range(len(results))]
+
+    @classmethod
+    def pool(cls, size):
+        """Creates a `ServicePool` of `size` preallocated instances of this class, reused across calls.
+
+        ```
+        pool = Crawler.pool(size=8)
+        pool.call({'user_id': 1, 'page_name': 'about.html'})
+        ```
+
+        Args:
+            size (int): The number of instances in the pool.
+
+        Returns:
+            ServicePool: The pool.
+        """
+        return ServicePool(cls, size)
+
+    @classmethod
+    def validate_columns(cls, columns):
+        """Validates a batch of inputs given as columns, without calling the service.
+
+        With NumPy installed (`pip install fireservice[numpy]`), type and range/length checks of built-in scalar
+        fields over NumPy array columns run as vectorized array operations. Otherwise, or for other fields, each row
+        is validated like in `call()`.
+
+        ```
+        errors = Crawler.validate_columns({
+            'user_id': numpy.array([1, 0, 3]),
+            'page_name': ['a.html', 'b.html', 'c.txt']
+        })
+        # {'user_id': [1], 'page_name': [2]}
+        ```
+
+        Args:
+            columns (dict): Maps field names to columns, either lists, tuples or NumPy arrays, all of the same length.
+
+        Returns:
+            dict: Maps the name of every field having invalid rows to the sorted list of their indices.
+
+        Raises:
+            UnknownParameterError: Raised when `columns` contains a key which doesn't match any declared `Field`.
+            FireServiceError: Raised when the columns have different lengths.
+        """
+        return columnar.validate_columns(cls._get_schema(), columns)
+
+    @classmethod
+    def validation_cache_info(cls):
+        """Statistics of the validation cache of a class declared with `validation_cache`.
+
+        The cache is dropped, and its counters reset, when a field of the class is added, replaced or removed.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum size and current size of the cache, or None without a cache.
+        """
+        cache = cls._get_schema().cache
+        return None if cache is None else cache.info()
+
+    @classmethod
+    def result_cache_info(cls):
+        """Statistics of the result cache of a class declared with `result_cache`.
+
+        A call is keyed by its validated field values and the keyword arguments of `fire()`, which should all be
+        built-in immutable values in `dict`, `list` and `tuple` containers, otherwise the call is not memoized.
+        Calls of services with lazy fields are never memoized, as the key would validate them.
+        `pre_fire()` runs for every call and can still skip it with `SkipError`. On a hit `fire()` doesn't run,
+        a copy of the memoized value is returned and `post_fire()` is called as if `fire()` had run. Exceptions
+        raised by `fire()` are not memoized, but are raised by the identical calls which waited for it.
+
+        Returns:
+            ResultCacheInfo: The hits, misses, coalesced calls, maximum size and current size of the cache,
+            or None without a cache.
+        """
+        return None if cls._results is None else cls._results.info()
+
+    _compiled = False
+    _collect_errors = False
+    _max_errors = 100
+    _validation_cache = None
+    _validation_ttl = None
+    _result_cache = None
+    _result_ttl = None
+    _results = None
+    _validation_order = 'cost'
+
+    def __init_subclass__(cls, compiled=None, collect_errors=None, max_errors=None, validation_cache=None,
+                          validation_ttl=None, result_cache=None, result_ttl=None, validation_order=None, **kwargs):
+        """
+        Args:
+            compiled (bool, optional): If True, a `_process_input` specialized for the fields of this class is
+            generated on its first call, inlining the checks of built-in fields and validators. Inherited by subclasses.
+            collect_errors (bool, optional): If True, all fields, including every item of a `ListField`, are validated
+            and the errors are raised together in an `AggregateValidationError`. Takes precedence over `compiled`.
+            Inherited by subclasses.
+            max_errors (int, optional): Maximum number of errors collected in `collect_errors` mode, validation stops
+            once it is reached. Defaults to 100. Inherited by subclasses.
+            validation_cache (int, optional): If given, the validated values of up to this many distinct inputs are
+            memoized, so a repeated input skips validation. Only inputs made of built-in immutable values in `dict`,
+            `list` and `tuple` containers are memoized, and values are copied in and out of the cache.
+            Set to 0 to disable a cache inherited from a base class.
+            validation_ttl (float, optional): If given, memoized values expire after this many seconds.
+            Inherited by subclasses.
+            result_cache (int, optional): If given, the return values of `fire()` for up to this many distinct
+            field values and keyword arguments are memoized, and identical calls in flight are coalesced so only one
+            `fire()` runs. Meant for read-only services, see `result_cache_info()`. Set to 0 to disable a cache
+            inherited from a base class. Each subclass has its own cache.
+            result_ttl (float, optional): If given, memoized return values expire after this many seconds.
+            Inherited by subclasses.
+            validation_order (str, optional): `cost` to reject invalid inputs with little work: the presence of
+            required fields is checked first, then fields are validated from the cheapest to the most expensive
+            by `Field.cost()`, like scalar fields before a `ListField`. `declaration` to validate fields in
+            declaration order. Fields are assigned to the instance in validation order, so use `declaration`
+            when the order of assignment matters. Defaults to `cost`. Inherited by subclasses.
+        """
+        super().__init_subclass__(**kwargs)
+        if compiled is not None:
+            cls._compiled = compiled
+        if collect_errors is not None:
+            cls._collect_errors = collect_errors
+        if max_errors is not None:
+            if max_errors < 1:
+                raise ValueError('max_errors should be at least 1')
+            cls._max_errors = max_errors
+        if validation_cache is not None:
+            if validation_cache < 0:
+                raise ValueError('validation_cache should not be negative')
+            cls._validation_cache = validation_cache
+        if validation_ttl is not None:
+            cls._validation_ttl = validation_ttl
+        if result_cache is not None:
+            if result_cache < 0:
+                raise ValueError('result_cache should not be negative')
+            cls._result_cache = result_cache
+        if result_ttl is not None:
+            cls._result_ttl = result_ttl
+        if validation_order is not None:
+            if validation_order not in VALIDATION_ORDERS:
+                raise ValueError('validation_order should be one of: %s' % ', '.join(VALIDATION_ORDERS))
+            cls._validation_order = validation_order
+        cls._results = ResultCache(cls._result_cache, cls._result_ttl) if cls._result_cache else None
+
     def _process_input(self, input):
-        fields = self._get_fields(type(self))
-        field_names = [name for name, _ in fields]
+        type(self)._get_schema().process(self, input)
+        self._freeze()
 
-        for key in input.keys():
-            if key not in field_names:
-                raise UnknownParameterError('Unknown parameter: %s provided' % key)
+    def _assign_values(self, values):
+        for name, value in values.items():
+            setattr(self, name, value)
+        self._freeze()
 
-        for name, desc_obj in fields:
-            input_value = input.get(name, Field.NULL)
-            desc_obj._init_value(self, input_value)
+    def _freeze(self):
+        pass
+
+    def _reset(self):
+        values = self.__dict__
+        for name in type(self)._get_schema().names:
+            values.pop(name, None)
+        values.pop(Field._MOD_FLAG_KEY, None)
+
+    @classmethod
+    def _get_schema(cls):
+        schema = cls.__dict__.get('_schema')
+        if schema is None:
+            with _schema_lock:
+                schema = cls.__dict__.get('_schema')
+                if schema is None:
+                    fields = cls._get_fields(cls)
+                    cache = LRUCache(cls._validation_cache, cls._validation_ttl) if cls._validation_cache else None
+                    schema = Schema(fields, cls._max_errors if cls._collect_errors else None, cls._get_slot_setters(fields),
+                                    cache, cls._validation_order)
+                    if cls._compiled and not cls._collect_errors:
+                        schema.compile(cls.__qualname__)
+                    type.__setattr__(cls, '_schema', schema)
+        return schema
+
+    @classmethod
+    def _invalidate_schema(cls):
+        if '_schema' in cls.__dict__:
+            type.__delattr__(cls, '_schema')
+        for subclass in cls.__subclasses__():
+            subclass._invalidate_schema()
 
     @staticmethod
     def _get_fields(subclass):
-        return [(name, desc_obj) for name, desc_obj in subclass.__dict__.items() if isinstance(desc_obj, Field)]
+        fields = {}
+        for klass in reversed(subclass.__mro__):
+            slot_fields = klass.__dict__.get('_slot_fields', {})
+            for name, desc_obj in klass.__dict__.items():
+                if isinstance(desc_obj, Field):
+                    fields[name] = desc_obj
+                elif name in slot_fields:
+                    fields[name] = slot_fields[name]
+                elif name in fields:
+                    del fields[name]
+        return list(fields.items())
+
+    @classmethod
+    def _get_slot_setters(cls, fields):
+        setters = {}
+        for name, _ in fields:
+            owner = next(klass for klass in cls.__mro__ if name in klass.__dict__)
+            if name in owner.__dict__.get('_slot_fields', ()):
+                setters[name] = owner.__dict__[name].__set__
+        return setters
 
     def pre_fire(self):
         """Method called before the execution of service, that is, called before the `fire()` method.
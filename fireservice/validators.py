@@ -1,58 +1,228 @@
 from fireservice.exceptions import ValidationError
 
 
+class Validator:
+    """Base class of the built-in validators.
+
+    A validator is called like a validator function, `validator(name, value)`, and raises `ValidationError` for an
+    invalid value. Validators are immutable, so a single instance is created once and shared by any number of fields.
+    They are composed with `&` (both should pass), `|` (either should pass) and `~` (should fail), also with plain
+    validator functions:
+
+    ```
+    code = StringField(validators=[required(), length(max_length=2) | length(min_length=5, max_length=5)])
+    ```
+
+    Compiled and vectorized validation read `kind` and `bounds` to inline the checks of known validators.
+    """
+    kind = None
+    """A name identifying the check, like `length` or `interval`, None for validators only known by calling them.
+    """
+    bounds = None
+    """The `(min, max)` bounds of `length` and `interval` validators.
+    """
+    is_noop = False
+    """True when the validator accepts every value, in which case fields skip it.
+    """
+
+    def __call__(self, name, value):
+        raise NotImplementedError()
+
+    def __and__(self, other):
+        return AllOf(self, other)
+
+    def __rand__(self, other):
+        return AllOf(other, self)
+
+    def __or__(self, other):
+        return AnyOf(self, other)
+
+    def __ror__(self, other):
+        return AnyOf(other, self)
+
+    def __invert__(self):
+        return Not(self)
+
+
+class Required(Validator):
+    """Fails for a None value.
+    """
+    kind = 'required'
+
+    def __call__(self, name, value):
+        if value is None:
+            raise ValidationError(name, code='required')
+
+    def __repr__(self):
+        return 'required()'
+
+
+class NotRequired(Validator):
+    """Accepts every value, marking a field as optional.
+    """
+    kind = 'not_required'
+    is_noop = True
+
+    def __call__(self, name, value):
+        pass
+
+    def __repr__(self):
+        return 'not_required()'
+
+
+class Length(Validator):
+    """Checks the length of a value using *__len__*.
+    """
+    kind = 'length'
+
+    def __init__(self, min_length=None, max_length=None):
+        self.bounds = (min_length, max_length)
+        self.is_noop = min_length is None and max_length is None
+
+    def __call__(self, name, value):
+        min_length, max_length = self.bounds
+        length = len(value)
+        if min_length is not None and length < min_length:
+            raise ValidationError(name, code='min_length', params={'length': length, 'min_length': min_length})
+        if max_length is not None and length > max_length:
+            raise ValidationError(name, code='max_length', params={'length': length, 'max_length': max_length})
+
+    def __repr__(self):
+        return 'length(min_length=%r, max_length=%r)' % self.bounds
+
+
+class Interval(Validator):
+    """Checks that a value falls within a range.
+    """
+    kind = 'interval'
+
+    def __init__(self, min_value=None, max_value=None):
+        self.bounds = (min_value, max_value)
+        self.is_noop = min_value is None and max_value is None
+
+    def __call__(self, name, value):
+        min_value, max_value = self.bounds
+        if min_value is not None and value < min_value:
+            raise ValidationError(name, code='min_value', params={'value': value, 'min_value': min_value})
+        if max_value is not None and value > max_value:
+            raise ValidationError(name, code='max_value', params={'value': value, 'max_value': max_value})
+
+    def __repr__(self):
+        return 'interval(min_value=%r, max_value=%r)' % self.bounds
+
+
+class AllOf(Validator):
+    """Passes when all its validators pass, which are applied in order until one fails.
+    """
+    kind = 'all'
+
+    def __init__(self, *validators):
+        self.validators = tuple(flatten(validators))
+        self.is_noop = not self.validators
+
+    def __call__(self, name, value):
+        for validator in self.validators:
+            validator(name, value)
+
+    def __repr__(self):
+        return ' & '.join(map(repr, self.validators)) if self.validators else 'AllOf()'
+
+
+class AnyOf(Validator):
+    """Passes when any of its validators passes, otherwise raises the error of the first one.
+    """
+    kind = 'any'
+
+    def __init__(self, *validators):
+        self.validators = validators
+        self.is_noop = any(getattr(validator, 'is_noop', False) for validator in validators)
+
+    def __call__(self, name, value):
+        error = None
+        for validator in self.validators:
+            try:
+                validator(name, value)
+                return
+            except ValidationError as ex:
+                if error is None:
+                    error = ex
+        if error is not None:
+            raise error
+
+    def __repr__(self):
+        return '(%s)' % ' | '.join(map(repr, self.validators))
+
+
+class Not(Validator):
+    """Passes when its validator fails.
+    """
+    kind = 'not'
+
+    def __init__(self, validator):
+        self.validator = validator
+
+    def __call__(self, name, value):
+        try:
+            self.validator(name, value)
+        except ValidationError:
+            return
+        raise ValidationError(name, code='invalid')
+
+    def __repr__(self):
+        return '~%r' % (self.validator,)
+
+
+def flatten(validators):
+    """Yields the validators of `validators` in application order, expanding `AllOf` and skipping no-op validators.
+    Fields apply their validators in this form.
+    """
+    for validator in validators:
+        if type(validator) is AllOf:
+            yield from validator.validators
+        elif not getattr(validator, 'is_noop', False):
+            yield validator
+
+
+_REQUIRED = Required()
+_NOT_REQUIRED = NotRequired()
+
+
 def required():
     """Makes value as required.
 
     Raises:
         `ValidationError`
     """
-    def _required(name, value):
-        if value is None:
-            raise ValidationError(name, 'Required field cannot be empty')
-    return _required
+    return _REQUIRED
 
 
 def not_required():
     """Makes value as optional.
     """
-    def _not_required(name, value):
-        pass
-    return _not_required
+    return _NOT_REQUIRED
 
 
 def length(*, min_length=None, max_length=None):
     """Checks value length using *__len__*
-    
+
     Args:
         min_length (int, optional): If given, provided value's length should be greater than this.
         max_length (int, optional): If given, provided value's length should be less than this.
-    
+
     Raises:
         `ValidationError`
     """
-    def _length(name, value):
-        length = len(value)
-        if min_length is not None and length < min_length:
-            raise ValidationError(name, 'Provided length: %s is less than min length: %s' % (length, min_length))
-        if max_length is not None and length > max_length:
-            raise ValidationError(name, 'Provided length: %s is greater than max length: %s' % (length, max_length))
-    return _length
+    return Length(min_length, max_length)
 
 
 def interval(*, min_value=None, max_value=None):
     """Checks if value falls within a range.
-    
+
     Args:
         min_value (int, optional): If given, provided value should be greater than this value.
         max_value (int, optional): If given, provided value should be less than this value.
-    
+
     Raises:
         `ValidationError`
     """
-    def _interval(name, value):
-        if min_value is not None and value < min_value:
-            raise ValidationError(name, 'Given value: %s is less than min: %s' % (value, min_value))
-        if max_value is not None and value > max_value:
-            raise ValidationError(name, 'Given value: %s is greater than max: %s' % (value, max_value))
-    return _interval
+    return Interval(min_value, max_value)
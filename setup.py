@@ -20,5 +20,9 @@ setuptools.setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
+    extras_require={
+        'numpy': ['numpy'],
+        'orjson': ['orjson'],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,339 @@
+import asyncio
+import threading
+import pytest
+from decimal import Decimal
+from datetime import datetime, time, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from fireservice.service import FireService
+from fireservice.fields import IntegerField, FloatField, ListField, DictField, StreamListField, DateTimeField
+from fireservice.validators import not_required
+from fireservice.exceptions import ValidationError, SkipError
+from fireservice.cache import LRUCache, CacheInfo, ResultCacheInfo, Uncacheable, MAX_DEPTH, fingerprint
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_evicts_least_recently_used_and_expired():
+    # Given: a cache of two entries with a ttl
+    clock = Clock()
+    cache = LRUCache(2, ttl=10, timer=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    # When: reading a, then adding c
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    # Then: b is evicted, and everything expires after the ttl
+    assert cache.get('b') is LRUCache.MISSING
+    assert cache.get('c') == 3
+    clock.now = 10
+    assert cache.get('a') is LRUCache.MISSING
+    assert cache.info() == CacheInfo(hits=2, misses=2, maxsize=2, currsize=1)
+
+
+@pytest.mark.parametrize('a, b', [
+    (1, 1.0),
+    (1, True),
+    ([1], (1,)),
+    ({'a': [1]}, {'a': [2]}),
+    (0.0, -0.0),
+    (complex(0.0, 0.0), complex(0.0, -0.0)),
+    (Decimal('1.0'), Decimal('1.00')),
+    (datetime(2019, 12, 4, 12, tzinfo=timezone.utc), datetime(2019, 12, 4, 13, tzinfo=timezone(timedelta(hours=1)))),
+    (time(12, tzinfo=timezone.utc), time(13, tzinfo=timezone(timedelta(hours=1)))),
+    (datetime(2019, 12, 4, 1, 30), datetime(2019, 12, 4, 1, 30, fold=1)),
+])
+def test_fingerprint_distinguishes_types_and_values(a, b):
+    assert fingerprint(a) != fingerprint(b)
+
+
+def test_fingerprint_ignores_key_order_and_rejects_other_types():
+    assert fingerprint({'a': 1, 'b': [2]}) == fingerprint({'b': [2], 'a': 1})
+    with pytest.raises(Uncacheable):
+        fingerprint({'a': {1, 2}})
+
+
+def nested_dict(depth):
+    value = {}
+    for _ in range(depth - 1):
+        value = {'a': value}
+    return value
+
+
+def test_fingerprint_rejects_deeply_nested_values():
+    assert fingerprint(nested_dict(MAX_DEPTH))
+    with pytest.raises(Uncacheable):
+        fingerprint(nested_dict(MAX_DEPTH + 1))
+    with pytest.raises(Uncacheable):
+        fingerprint(nested_dict(5000))
+
+
+class CachedService(FireService, validation_cache=2):
+    a = FloatField()
+    b = ListField(IntegerField(min_value=0), validators=[not_required()], default=[])
+    c = DictField(validators=[not_required()])
+
+    def fire(self, **kwargs):
+        return self.a, self.b, self.c
+
+
+def test_validation_cache_skips_validation_of_repeated_input():
+    # Given: a service with a validation cache
+    CachedService._invalidate_schema()
+
+    # When: calling it twice with equal inputs
+    first = CachedService().call({'a': 1.0, 'b': [1, 2], 'c': {'x': 1}})
+    second = CachedService().call({'b': [1, 2], 'a': 1.0, 'c': {'x': 1}})
+
+    # Then: the second call is a hit returning equal but unshared values
+    assert first == second
+    assert first[1] is not second[1] and first[2] is not second[2]
+    assert CachedService.validation_cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_validation_cache_is_safe_for_mutated_and_invalid_input():
+    # Given: a service with a validation cache
+    CachedService._invalidate_schema()
+    input = {'a': 1.0, 'b': [1]}
+    CachedService().call(input)
+
+    # When: the input is mutated into an invalid one, or has the same value with another type
+    input['b'].append(-1)
+
+    # Then: it is validated again
+    with pytest.raises(ValidationError):
+        CachedService().call(input)
+    with pytest.raises(ValidationError):
+        CachedService().call({'a': 1, 'b': [1]})
+    with pytest.raises(ValidationError):
+        CachedService().call({'a': 1, 'b': [1]})
+    assert CachedService.validation_cache_info().hits == 0
+
+
+@pytest.mark.parametrize('depth', [MAX_DEPTH - 1, 300, 2000])
+def test_validation_cache_validates_deeply_nested_input(depth):
+    # Given: a service with a validation cache
+    CachedService._invalidate_schema()
+    value = nested_dict(depth)
+
+    # When: calling it twice with a deeply nested input
+    # Then: both calls succeed, the input being cached only when its depth allows it
+    for _ in range(2):
+        assert CachedService().call({'a': 1.0, 'c': value})[2]['a']
+    assert CachedService.validation_cache_info().hits == (1 if depth < MAX_DEPTH else 0)
+
+
+def test_validation_cache_never_shares_streams():
+    # Given: a service with a validation cache and a streamed field
+    class Service(FireService, validation_cache=10):
+        rows = StreamListField(IntegerField(max_value=2))
+
+        def fire(self, **kwargs):
+            return list(self.rows)
+
+    # When: calling it twice with an equal input holding an invalid item
+    # Then: both calls validate their own stream
+    for _ in range(2):
+        with pytest.raises(ValidationError) as ex:
+            Service().call({'rows': [1, 2, 3]})
+        assert ex.value.field == 'rows[2]'
+    assert Service().call({'rows': [1, 2]}) == [1, 2]
+    assert Service().call({'rows': [1, 2]}) == [1, 2]
+    assert Service.validation_cache_info().currsize == 0
+
+
+def test_validation_cache_keeps_timezones_of_equal_datetimes():
+    # Given: a service with a validation cache which was called with a UTC datetime
+    class Service(FireService, validation_cache=10):
+        at = DateTimeField()
+
+        def fire(self, **kwargs):
+            return self.at
+
+    utc = datetime(2019, 12, 4, 12, tzinfo=timezone.utc)
+    assert Service().call({'at': utc}).tzinfo is timezone.utc
+
+    # When: calling it with the same instant in another timezone
+    other = datetime(2019, 12, 4, 13, tzinfo=timezone(timedelta(hours=1)))
+
+    # Then: the provided value is kept
+    assert Service().call({'at': other}).utcoffset() == timedelta(hours=1)
+
+
+def test_result_cache_skips_fire_but_keeps_callbacks():
+    # Given: a read-only service with a result cache
+    calls = []
+
+    class Service(FireService, result_cache=10):
+        a = IntegerField()
+
+        def pre_fire(self):
+            calls.append('pre_fire')
+            if self.a < 0:
+                raise SkipError()
+
+        def fire(self, **kwargs):
+            calls.append('fire')
+            return [self.a, kwargs]
+
+        def post_fire(self, fired, exc):
+            calls.append((fired, exc))
+
+    # When: calling it twice with the same values, then with other keyword arguments, then skipping
+    first = Service().call({'a': 1}, b=2)
+    second = Service().call({'a': 1}, b=2)
+    Service().call({'a': 1}, b=3)
+    Service().call({'a': -1})
+
+    # Then: fire() runs once per distinct call and hits return a copy
+    assert first == second == [1, {'b': 2}]
+    assert first is not second
+    assert calls[:-1] == ['pre_fire', 'fire', (True, None), 'pre_fire', (True, None), 'pre_fire', 'fire', (True, None),
+                          'pre_fire']
+    assert calls[-1][0] is False and isinstance(calls[-1][1], SkipError)
+    assert Service.result_cache_info() == ResultCacheInfo(hits=1, misses=2, coalesced=0, maxsize=10, currsize=2)
+
+
+def test_result_cache_coalesces_concurrent_thread_calls():
+    # Given: a slow service with a result cache
+    started = threading.Event()
+    release = threading.Event()
+    fired = []
+
+    class Service(FireService, result_cache=10):
+        a = IntegerField()
+
+        def fire(self, **kwargs):
+            fired.append(self.a)
+            started.set()
+            release.wait(5)
+            return self.a * 2
+
+    # When: identical calls are made while the first one runs
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(Service().call, {'a': 21})
+        started.wait(5)
+        waiters = [executor.submit(Service().call, {'a': 21}) for _ in range(3)]
+        while Service.result_cache_info().coalesced < 3:
+            pass
+        release.set()
+        results = [future.result() for future in [leader] + waiters]
+
+    # Then: fire() runs once and all calls get its value
+    assert results == [42] * 4
+    assert fired == [21]
+    assert Service.result_cache_info().coalesced == 3
+
+
+def test_result_cache_coalesces_asyncio_calls_and_shares_errors():
+    # Given: an async service with a result cache
+    fired = []
+
+    class Service(FireService, result_cache=10):
+        a = IntegerField()
+
+        async def fire(self, **kwargs):
+            fired.append(self.a)
+            await asyncio.sleep(0.01)
+            if self.a < 0:
+                raise ValueError(self.a)
+            return self.a
+
+    async def run(a):
+        return await asyncio.gather(*[Service().acall({'a': a}) for _ in range(5)], return_exceptions=True)
+
+    # When: gathering identical calls
+    # Then: fire() runs once, its errors are shared but not cached
+    assert asyncio.run(run(3)) == [3] * 5
+    errors = asyncio.run(run(-1))
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert asyncio.run(Service().acall({'a': 3})) == 3
+    assert fired == [3, -1]
+    assert Service.result_cache_info() == ResultCacheInfo(hits=1, misses=2, coalesced=8, maxsize=10, currsize=1)
+
+
+def test_result_cache_cancelled_call_does_not_cancel_waiting_calls():
+    # Given: an async service with a result cache
+    fired = []
+
+    class Service(FireService, result_cache=10):
+        a = IntegerField()
+
+        async def fire(self, **kwargs):
+            fired.append(self.a)
+            await asyncio.sleep(0.01)
+            return self.a
+
+    async def run():
+        first = asyncio.ensure_future(Service().acall({'a': 3}))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(Service().acall({'a': 3}))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    # When: the call running fire() is cancelled while another waits for it
+    first, second = asyncio.run(run())
+
+    # Then: only the cancelled call fails, the waiting one runs fire() itself
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == 3
+    assert fired == [3, 3]
+
+
+def test_result_cache_waiting_calls_get_unshared_values():
+    # Given: an async service with a result cache
+    class Service(FireService, result_cache=10):
+        a = IntegerField()
+
+        async def fire(self, **kwargs):
+            await asyncio.sleep(0.01)
+            return {'x': [self.a]}
+
+    async def mutate():
+        value = await Service().acall({'a': 1})
+        value['x'].append('MUTATED')
+        return value
+
+    async def run():
+        first = asyncio.ensure_future(mutate())
+        await asyncio.sleep(0)
+        return await asyncio.gather(first, Service().acall({'a': 1}))
+
+    # When: the call running fire() mutates its value before a waiting call wakes up
+    first, second = asyncio.run(run())
+
+    # Then: the waiting call gets the value returned by fire()
+    assert first == {'x': [1, 'MUTATED']}
+    assert second == {'x': [1]}
+
+
+def test_result_cache_leaves_lazy_fields_unvalidated():
+    # Given: a read-only service with a result cache and a lazy field
+    class Service(FireService, result_cache=10):
+        a = IntegerField()
+        b = ListField(IntegerField(min_value=0), lazy=True)
+
+        def pre_fire(self):
+            if self.a < 0:
+                raise SkipError()
+
+        def fire(self, **kwargs):
+            return sum(self.b)
+
+    # When: a call is skipped
+    # Then: the invalid lazy field is never validated
+    assert Service().call({'a': -1, 'b': [-1]}) is None
+
+    # When: calling it twice with the same input
+    # Then: the calls are not memoized
+    assert Service().call({'a': 1, 'b': [1, 2]}) == 3
+    assert Service().call({'a': 1, 'b': [1, 2]}) == 3
+    assert Service.result_cache_info().currsize == 0
@@ -0,0 +1,77 @@
+import pytest
+from fireservice.service import FireService
+from fireservice.fields import IntegerField, FloatField, StringField, BooleanField, EmailField
+from fireservice.validators import not_required, length, interval
+from fireservice.exceptions import FireServiceError, UnknownParameterError
+
+
+class Service(FireService):
+    a = IntegerField(min_value=1, max_value=10)
+    b = FloatField(validators=[interval(max_value=1.0)])
+    c = StringField(min_length=2, validators=[length(max_length=3)])
+    d = BooleanField(validators=[not_required()])
+    e = EmailField(default='a@b.com')
+
+    def fire(self, **kwargs):
+        pass
+
+
+COLUMNS = {
+    'a': [1, 0, 5, 11, 2.5],
+    'b': [0.5, 1.5, 0.1, 0.2, 1],
+    'c': ['ab', 'abc', 'a', 'abcd', 'ok'],
+    'd': [True, None, 1, False, True],
+}
+ERRORS = {'a': [1, 3, 4], 'b': [1, 4], 'c': [2, 3], 'd': [2]}
+
+
+def test_validate_columns_reports_invalid_rows():
+    # Given: columns with invalid rows
+    # When: validating them
+    # Then: the invalid rows are reported per field
+    assert Service.validate_columns(COLUMNS) == ERRORS
+
+
+def test_validate_columns_matches_row_validation():
+    # Given: columns with invalid rows
+    # When: calling the service row by row
+    rows = [dict(zip(COLUMNS, values)) for values in zip(*COLUMNS.values())]
+    results = list(Service.call_many(rows, fail_fast=False))
+
+    # Then: the same rows fail
+    failed = sorted(set(i for invalid in ERRORS.values() for i in invalid))
+    assert [i for i, result in enumerate(results) if result.error] == failed
+
+
+def test_validate_columns_missing_column_uses_default():
+    # Given: a required column without default is missing
+    columns = {key: value for key, value in COLUMNS.items() if key != 'a'}
+
+    # When: validating
+    # Then: every row is invalid for that field
+    assert Service.validate_columns(columns)['a'] == [0, 1, 2, 3, 4]
+
+
+def test_validate_columns_rejects_unknown_or_uneven_columns():
+    with pytest.raises(UnknownParameterError):
+        Service.validate_columns({**COLUMNS, 'z': [1] * 5})
+    with pytest.raises(FireServiceError):
+        Service.validate_columns({**COLUMNS, 'a': [1]})
+
+
+def test_validate_numpy_columns():
+    numpy = pytest.importorskip('numpy')
+    # Given: NumPy columns of native dtypes
+    columns = {
+        'a': numpy.array([1, 0, 5, 11, 2]),
+        'b': numpy.array([0.5, 1.5, 0.1, 0.2, 1.0]),
+        'c': numpy.array(['ab', 'abc', 'a', 'abcd', 'ok']),
+        'd': numpy.array([True, False, True, False, True]),
+    }
+
+    # When: validating them
+    # Then: the same invalid rows are reported as for Python values
+    assert Service.validate_columns(columns) == {'a': [1, 3], 'b': [1], 'c': [2, 3]}
+    assert Service.validate_columns({**columns, 'a': columns['b']})['a'] == [0, 1, 2, 3, 4]
+    assert Service.validate_columns({**columns, 'e': numpy.array(['a@b.c', 'x', 'a@b.c', 'a@b.c', 'a@b.c'])}) \
+        == {'a': [1, 3], 'b': [1], 'c': [2, 3], 'e': [1]}
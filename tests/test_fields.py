@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from fireservice.validators import *
 from fireservice.fields import *
 from fireservice.exceptions import ValidationError
@@ -208,3 +208,367 @@ def test_modification_error_when_assigned_value_again(field, value):
     # Then: raise error
     with pytest.raises(ModificationError):
         field._init_value(fh, value)
+
+
+@pytest.mark.parametrize('field, value, path', [
+    (ListField(IntegerField()), [1, 'a'], 'a[1]'),
+    (ListField(ListField(IntegerField())), [[1], [2, 'b']], 'a[1][1]'),
+    (ListField(ListField(IntegerField())), [[1], 2], 'a[1]'),
+    (ListField(ListField(ListField(CharacterField()))), [[['a']], [['b', 'cc']]], 'a[1][0][1]'),
+    (ListField(ListField(IntegerField(), max_length=1)), [[1], [1, 2]], 'a[1]'),
+])
+def test_list_item_error_reports_path(field, value, path):
+    # Given: a list field
+    fh = init_field_holder(field)
+
+    # When: init with an invalid item
+    # Then: raise error labelled with the path of the item
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+    assert ex.value.field == path
+
+
+def test_list_items_validated_without_field_instantiation(monkeypatch):
+    # Given: a nested list field
+    field = ListField(ListField(IntegerField(min_value=0)))
+    fh = init_field_holder(field)
+    created = []
+    monkeypatch.setattr(Field, '__init__', lambda *args, **kwargs: created.append(args))
+
+    # When: init with a value
+    field._init_value(fh, ([1, 2], (3,)))
+
+    # Then: no item field is created and tuples are stored as lists
+    assert created == []
+    assert field.__get__(fh, type(fh)) == [[1, 2], [3]]
+    assert fh.__dict__.keys() == {'a', Field._MOD_FLAG_KEY}
+
+
+@pytest.mark.parametrize('field, value, code, params, error', [
+    (IntegerField(), None, 'required', None, 'Required field cannot be empty'),
+    (IntegerField(), 'a', 'type', {'type': 'numeric'}, 'Not of numeric type'),
+    (IntegerField(max_value=1), 2, 'max_value', {'value': 2, 'max_value': 1}, 'Given value: 2 is greater than max: 1'),
+    (StringField(min_length=2), 'a', 'min_length', {'length': 1, 'min_length': 2},
+     'Provided length: 1 is less than min length: 2'),
+    (CharacterField(), 'ab', 'length', {'expected': 1, 'length': 2}, 'Should have length: 1 but has length: 2'),
+    (EmailField(), 'a', 'email', None, 'Not a valid email'),
+])
+def test_validation_error_has_code_and_lazy_message(field, value, code, params, error):
+    # Given: a field
+    fh = init_field_holder(field)
+
+    # When: init with an invalid value
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+
+    # Then: the error carries a code and params, and formats its message on demand
+    assert (ex.value.code, ex.value.params) == (code, params)
+    assert ex.value._error is None
+    assert ex.value.args == ('a', None, code, params)
+    assert ex.value.error == error
+    assert str(ex.value) == 'Field "a": %s' % error
+
+
+def test_nested_list_error_path_built_once():
+    # Given: a nested list field
+    field = ListField(ListField(ListField(IntegerField(max_value=5))))
+    fh = init_field_holder(field)
+
+    # When: an inner item is invalid
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, [[[1]], [[2], [3, 6]]])
+
+    # Then: the same error object bubbles up and its path is built when read
+    assert ex.value._segments == [('', 1), ('', 1), ('a', 1)]
+    assert ex.value.field == 'a[1][1][1]'
+    assert ex.value.code == 'max_value'
+
+
+@pytest.mark.parametrize('field, value, expected', [
+    (IntegerField(coerce=True), '42', 42),
+    (IntegerField(coerce=True), 42, 42),
+    (FloatField(coerce=True), '4.5', 4.5),
+    (FloatField(coerce=True), 4, 4.0),
+    (IntegerField(coerce=True), '-0', 0),
+    (FloatField(coerce=True), '-1.5e-3', -0.0015),
+    (FloatField(coerce=True), '7', 7.0),
+    (DateField(coerce=True), '2019-12-04', date(2019, 12, 4)),
+    (DateTimeField(coerce=True), '2019-12-04T10:20:30', datetime(2019, 12, 4, 10, 20, 30)),
+    (DateTimeField(coerce=True), '2019-12-04T10:20:30Z', datetime(2019, 12, 4, 10, 20, 30, tzinfo=timezone.utc)),
+    (ListField(IntegerField(coerce=True, min_value=1)), ['1', 2], [1, 2]),
+])
+def test_coerce_converts_value(field, value, expected):
+    # Given: a field declared with coerce
+    fh = init_field_holder(field)
+
+    # When: init with a value to convert
+    field._init_value(fh, value)
+
+    # Then: the converted value is stored
+    assert field.__get__(fh, type(fh)) == expected
+
+
+@pytest.mark.parametrize('field, value, code', [
+    (IntegerField(coerce=True), '4.5', 'parse'),
+    (IntegerField(coerce=True, min_value=5), '4', 'min_value'),
+    (FloatField(coerce=True), 'x', 'parse'),
+    (DateField(coerce=True), '2019-13-04', 'parse'),
+    (DateTimeField(coerce=True), 'yesterday', 'parse'),
+    (DateField(coerce=True), 1, 'type'),
+    (IntegerField(), '42', 'type'),
+    (IntegerField(coerce=True), ' 4_2 ', 'parse'),
+    (IntegerField(coerce=True), '+1', 'parse'),
+    (IntegerField(coerce=True), '٤٢', 'parse'),
+    (FloatField(coerce=True, min_value=0, max_value=1), 'nan', 'parse'),
+    (FloatField(coerce=True), 'inf', 'parse'),
+    (FloatField(coerce=True), '-Infinity', 'parse'),
+    (FloatField(coerce=True), '1e400', 'parse'),
+    (FloatField(coerce=True), ' 4.2', 'parse'),
+    (FloatField(coerce=True), 10 ** 400, 'parse'),
+])
+def test_coerce_invalid_value_raises_error(field, value, code):
+    fh = init_field_holder(field)
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+    assert ex.value.code == code
+
+
+def test_stream_list_field_validates_items_lazily():
+    # Given: a stream field fed by a generator
+    field = StreamListField(IntegerField(min_value=0))
+    fh = init_field_holder(field)
+    consumed = []
+
+    def produce():
+        for value in (1, 2, -3, 4):
+            consumed.append(value)
+            yield value
+
+    # When: init with the generator
+    field._init_value(fh, produce())
+    stream = field.__get__(fh, type(fh))
+
+    # Then: nothing is read until the stream is iterated, and an invalid item fails the iteration
+    assert consumed == []
+    assert next(stream) == 1
+    assert next(stream) == 2
+    with pytest.raises(ValidationError) as ex:
+        next(stream)
+    assert ex.value.field == 'a[2]'
+    assert ex.value.code == 'min_value'
+    assert consumed == [1, 2, -3]
+
+
+@pytest.mark.parametrize('field, value, code', [
+    (StreamListField(IntegerField()), 'abc', 'type'),
+    (StreamListField(IntegerField()), {'a': 1}, 'type'),
+    (StreamListField(IntegerField()), 1, 'type'),
+])
+def test_stream_list_field_invalid_type_raises_error(field, value, code):
+    fh = init_field_holder(field)
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+    assert ex.value.code == code
+
+
+@pytest.mark.parametrize('field, value, code', [
+    (StreamListField(IntegerField(), min_length=3), iter([1, 2]), 'min_length'),
+    (StreamListField(IntegerField(), max_length=2), iter([1, 2, 3, 4]), 'max_length'),
+])
+def test_stream_list_field_length_checked_while_iterating(field, value, code):
+    # Given: a stream field with length bounds
+    fh = init_field_holder(field)
+    field._init_value(fh, value)
+
+    # When: the stream is consumed
+    # Then: the bound is checked by the iteration
+    with pytest.raises(ValidationError) as ex:
+        list(field.__get__(fh, type(fh)))
+    assert ex.value.code == code
+
+
+def test_stream_list_field_decodes_json_lines():
+    # Given: a stream field reading JSON lines
+    field = StreamListField(DictField(), json_lines=True)
+    fh = init_field_holder(field)
+
+    # When: init with lines, including a blank one and an invalid one
+    field._init_value(fh, iter(['{"x": 1}\n', '\n', '{"x": 2}\n', '{x\n']))
+    stream = field.__get__(fh, type(fh))
+
+    # Then: lines are decoded and the invalid line fails with its index
+    assert next(stream) == {'x': 1}
+    assert next(stream) == {'x': 2}
+    with pytest.raises(ValidationError) as ex:
+        next(stream)
+    assert ex.value.field == 'a[2]'
+    assert ex.value.code == 'parse'
+
+
+@pytest.mark.parametrize('value', [
+    b'\x89PNG\r\n',
+    bytearray(b'\x89PNG\r\n'),
+    memoryview(b'\x89PNG\r\n'),
+])
+def test_bytes_field_stores_buffer_without_copy(value):
+    # Given: a bytes field with a prefix
+    field = BytesField(prefix=b'\x89PNG', max_length=6)
+    fh = init_field_holder(field)
+
+    # When: init with a binary value
+    field._init_value(fh, value)
+
+    # Then: the same object is stored
+    assert field.__get__(fh, type(fh)) is value
+
+
+def test_bytes_field_accepts_mmap():
+    # Given: a bytes field checking UTF-8 in small chunks
+    import mmap
+    field = BytesField(utf8=True, prefix=(b'GIF', b'caf'))
+    field.UTF8_CHUNK_SIZE = 3
+    fh = init_field_holder(field)
+    data = mmap.mmap(-1, 6)
+    data.write('café'.encode())
+
+    # When: init with a memory map whose multi-byte character spans two chunks
+    field._init_value(fh, data)
+
+    # Then: the map is stored and can still be closed
+    assert field.__get__(fh, type(fh)) is data
+    data.close()
+
+
+@pytest.mark.parametrize('field, value, code', [
+    (BytesField(), 'abc', 'type'),
+    (BytesField(min_length=4), b'abc', 'min_length'),
+    (BytesField(validators=[length(max_length=2)]), bytearray(b'abc'), 'max_length'),
+    (BytesField(prefix=b'%PDF'), b'PK\x03\x04', 'prefix'),
+    (BytesField(prefix=b'%PDF'), b'%P', 'prefix'),
+    (BytesField(utf8=True), b'caf\xc3', 'encoding'),
+    (BytesField(utf8=True), memoryview(b'\xff\xfe'), 'encoding'),
+    (BytesField(utf8=True), memoryview(b'aabbcc')[::2], 'type'),
+    (BytesField(), memoryview(b'aabbcc')[::2], 'type'),
+])
+def test_bytes_field_invalid_value_raises_error(field, value, code):
+    fh = init_field_holder(field)
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+    assert ex.value.code == code
+
+
+@pytest.mark.parametrize('validator, value, code', [
+    (length(max_length=2) | length(min_length=5, max_length=5), 'abc', 'max_length'),
+    (length(max_length=2) | length(min_length=5, max_length=5), 'abcde', None),
+    (length(min_length=1) & interval(max_value='m'), 'z', 'max_value'),
+    (length(min_length=1) & interval(max_value='m'), 'a', None),
+    (~length(max_length=2), 'ab', 'invalid'),
+    (~length(max_length=2), 'abc', None),
+])
+def test_validators_compose(validator, value, code):
+    # Given: a field with a composed validator
+    field = StringField(validators=[required(), validator])
+    fh = init_field_holder(field)
+
+    # When: init with a value
+    # Then: the composition decides whether it is valid
+    if code is None:
+        field._init_value(fh, value)
+        assert field.__get__(fh, type(fh)) == value
+        return
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+    assert ex.value.code == code
+
+
+def test_validators_are_shared_and_introspectable():
+    # Given: built-in validators
+    both = required() & length(min_length=1) & not_required() & length()
+
+    # Then: stateless ones are shared, bounds are readable and no-ops are skipped when composing
+    assert required() is required()
+    assert length(min_length=1, max_length=3).bounds == (1, 3)
+    assert interval().is_noop and length().is_noop and not_required().is_noop
+    assert [validator.kind for validator in both.validators] == ['required', 'length']
+    assert repr(both) == 'required() & length(min_length=1, max_length=None)'
+    assert StringField(validators=[not_required(), length()])._validators == ()
+
+
+@pytest.mark.parametrize('field, value, expected', [
+    (EmailField(), 'a b@c.d', True),
+    (EmailField(strict=True), 'a b@c.d', False),
+    (EmailField(strict=True), 'first.last+tag@mail.example.com', True),
+    (EmailField(strict=True), 'first..last@example.com', False),
+    (EmailField(strict=True), 'user@-example.com', False),
+    (EmailField(strict=True), 'user@example.c', False),
+    (EmailField(strict=True), '%s@example.com' % ('a' * 65), False),
+    (EmailField(strict=True), 'user@bücher.de', False),
+    (EmailField(strict=True, idna=True), 'user@Bücher.DE', True),
+])
+def test_email_field_modes(field, value, expected):
+    # Given: an email field in a given mode
+    fh = init_field_holder(field)
+
+    # When: validating an address one by one and in a batch
+    try:
+        field._init_value(fh, value)
+        valid = True
+    except ValidationError as ex:
+        assert ex.code == 'email'
+        valid = False
+
+    # Then: both agree
+    assert valid == expected
+    assert (field.validate_many([value])[0] is not None) == expected
+
+
+def test_email_field_idna_normalizes_domain():
+    # Given: an email field normalizing domains
+    field = EmailField(idna=True)
+    fh = init_field_holder(field)
+
+    # When: init with an internationalized domain
+    field._init_value(fh, 'Jörg@Bücher.de')
+
+    # Then: the domain is stored in lowercase ASCII form
+    assert field.__get__(fh, type(fh)) == 'Jörg@xn--bcher-kva.de'
+
+
+@pytest.mark.parametrize('value', ['a@b..com', 'a@%s.com' % ('x' * 70)])
+def test_email_field_idna_rejects_unencodable_domain(value):
+    # Given: an email field normalizing domains
+    field = EmailField(idna=True)
+    fh = init_field_holder(field)
+
+    # When: init with a domain IDNA can't encode
+    # Then: it is rejected, like by validate_many()
+    with pytest.raises(ValidationError) as ex:
+        field._init_value(fh, value)
+    assert ex.value.code == 'email'
+    assert field.validate_many([value]) == [None]
+
+
+def test_email_field_validate_many_caches_domains():
+    # Given: an email field
+    field = EmailField(idna=True)
+
+    # When: validating a batch with repeated domains
+    results = field.validate_many(['a@Gmail.com', 'b@gmail.com', 'c@GMAIL.COM', 'bad', None, 'd@bücher.de'])
+
+    # Then: each domain is looked up once and results keep the order
+    assert results == ['a@gmail.com', 'b@gmail.com', 'c@gmail.com', None, None, 'd@xn--bcher-kva.de']
+    assert field._domains.cache_info().misses == 4
+
+
+def test_field_cost_estimates():
+    # Given: scalar and container fields
+    # Then: scalars have a constant cost, containers a cost proportional to their length
+    assert IntegerField().cost() == IntegerField().cost(1000)
+    assert StringField().cost() < EmailField().cost()
+    assert IntegerField(coerce=True).cost() > IntegerField().cost()
+    assert ListField(IntegerField()).cost(100) > 10 * ListField(IntegerField()).cost(5)
+    assert ListField(IntegerField(), max_length=4).cost() < ListField(IntegerField()).cost()
+    assert ListField(EmailField()).cost(10) > ListField(IntegerField()).cost(10)
+
+    # Then: lazy fields cost nothing to a call
+    assert ListField(IntegerField(), lazy=True).cost() == 0
@@ -0,0 +1,150 @@
+import asyncio
+import pytest
+from fireservice import instrumentation
+from fireservice.service import FireService
+from fireservice.fields import IntegerField, ListField
+from fireservice.exceptions import ValidationError, SkipError
+from fireservice.instrumentation import Observer, MetricsAggregator, Histogram
+
+
+class RecordingObserver(Observer):
+    def __init__(self, field_timings=False):
+        self.field_timings = field_timings
+        self.records = []
+
+    def on_call(self, record):
+        self.records.append(record)
+
+
+class Service(FireService):
+    a = IntegerField(min_value=0)
+    b = ListField(IntegerField(), default=[])
+
+    def pre_fire(self):
+        if self.a == 1:
+            raise SkipError()
+
+    def fire(self, **kwargs):
+        if self.a == 2:
+            raise KeyError(self.a)
+        return self.a
+
+
+@pytest.fixture
+def observer():
+    observer = RecordingObserver()
+    instrumentation.register(observer)
+    yield observer
+    instrumentation.unregister(observer)
+
+
+@pytest.mark.parametrize('input, outcome, exception, phases', [
+    ({'a': 0}, 'ok', None, ['validate', 'pre_fire', 'fire', 'post_fire']),
+    ({'a': 1}, 'skipped', SkipError, ['validate', 'pre_fire', 'post_fire']),
+    ({'a': 2}, 'error', KeyError, ['validate', 'pre_fire', 'fire']),
+    ({'a': -1}, 'invalid', ValidationError, ['validate']),
+    (None, 'error', TypeError, ['validate']),
+])
+def test_observer_receives_phases_and_outcome(observer, input, outcome, exception, phases):
+    # Given: a registered observer
+    # When: calling a service
+    try:
+        Service().call(input)
+    except (KeyError, TypeError, ValidationError):
+        pass
+
+    # Then: the observer gets the timings of the phases which ran and the outcome
+    record, = observer.records
+    assert record.service_class is Service
+    assert list(record.phases) == phases
+    assert all(seconds >= 0 for seconds in record.phases.values())
+    assert (record.outcome, record.exception, record.fields) == (outcome, exception, None)
+
+
+def test_observer_receives_field_timings_of_async_calls():
+    # Given: an observer asking for field timings
+    observer = RecordingObserver(field_timings=True)
+    instrumentation.register(observer)
+    try:
+        # When: awaiting a call
+        assert asyncio.run(Service().acall({'a': 3, 'b': [1, 2]})) == 3
+    finally:
+        instrumentation.unregister(observer)
+
+    # Then: each field is timed
+    record, = observer.records
+    assert list(record.fields) == ['a', 'b']
+    assert list(record.phases) == ['validate', 'pre_fire', 'fire', 'post_fire']
+
+
+def test_observer_receives_outcome_of_async_calls(observer):
+    # Given: a registered observer
+    # When: awaiting calls which are skipped or fail
+    asyncio.run(Service().acall({'a': 1}))
+    with pytest.raises(KeyError):
+        asyncio.run(Service().acall({'a': 2}))
+
+    # Then: the outcome of each call is recorded
+    skipped, failed = observer.records
+    assert (skipped.outcome, skipped.exception, list(skipped.phases)) == \
+        ('skipped', SkipError, ['validate', 'pre_fire', 'post_fire'])
+    assert (failed.outcome, failed.exception, list(failed.phases)) == ('error', KeyError, ['validate', 'pre_fire', 'fire'])
+
+
+def test_metrics_aggregator_reports_per_service():
+    # Given: a registered aggregator
+    metrics = MetricsAggregator(field_timings=True)
+    instrumentation.register(metrics)
+    try:
+        # When: calling a service several times
+        for a in [0, 0, 1, -1]:
+            try:
+                Service().call({'a': a})
+            except ValidationError:
+                pass
+    finally:
+        instrumentation.unregister(metrics)
+
+    # Then: calls are counted per outcome with percentiles per phase and field
+    report = metrics.report()[Service]
+    assert report['calls'] == 4
+    assert report['outcomes'] == {'ok': 2, 'skipped': 1, 'invalid': 1}
+    assert report['exceptions'] == {'SkipError': 1, 'ValidationError': 1}
+    assert report['phases']['validate']['count'] == 4
+    assert report['phases']['fire']['count'] == 2
+    assert set(report['phases']['fire']) == {'count', 'mean', 'min', 'max', 'p50', 'p95', 'p99'}
+    assert report['fields']['a']['count'] == 3
+
+
+def test_histogram_percentiles_within_precision():
+    # Given: durations from 1 to 1000 microseconds
+    histogram = Histogram(precision=0.01)
+    for i in range(1, 1001):
+        histogram.add(i * 1e-6)
+
+    # Then: percentiles are within 1%
+    assert histogram.percentile(50) == pytest.approx(500e-6, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(990e-6, rel=0.01)
+    assert histogram.percentile(100) == 1000e-6
+    assert Histogram().percentile(50) is None
+
+
+def test_field_timings_leave_lazy_fields_unvalidated():
+    # Given: an observer asking for field timings and a service with a lazy field
+    class Lazy(FireService):
+        a = IntegerField()
+        b = ListField(IntegerField(min_value=0), lazy=True)
+
+        def pre_fire(self):
+            raise SkipError()
+
+    observer = RecordingObserver(field_timings=True)
+    instrumentation.register(observer)
+    try:
+        # When: a call is skipped
+        # Then: the invalid lazy field is never validated nor timed
+        assert Lazy().call({'a': 1, 'b': [-1]}) is None
+    finally:
+        instrumentation.unregister(observer)
+    record, = observer.records
+    assert (record.outcome, list(record.fields)) == ('skipped', ['a'])
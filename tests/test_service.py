@@ -1,7 +1,15 @@
+import os
+import abc
+import sys
+import pickle
+import asyncio
+from datetime import date
 import pytest
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from fireservice.service import FireService
-from fireservice.fields import IntegerField
+from fireservice.fields import IntegerField, StringField, BooleanField, EmailField, ListField, DateField, SchemaField
+from fireservice.validators import required, not_required, length
 from fireservice.exceptions import *
 
 
@@ -157,4 +165,834 @@ def test_multiple_service_instances_have_different_field_values():
 
     # Then: each service instant should store its own value
     assert s1.a == 10
-    assert s2.a == 20
\ No newline at end of file
+    assert s2.a == 20
+
+
+def test_abstract_base_service():
+    # Given: an abstract service mixing in abc.ABC
+    class Base(FireService, abc.ABC):
+        a = IntegerField()
+
+        @abc.abstractmethod
+        def fire(self, **kwargs):
+            pass
+
+    class Service(Base):
+        def fire(self, **kwargs):
+            return self.a
+
+    # Then: the abstract service can't be instantiated but its subclasses can be called
+    with pytest.raises(TypeError):
+        Base()
+    assert Service().call({'a': 1}) == 1
+    assert isinstance(Service(), abc.ABC)
+
+
+def test_schema_is_cached_per_class():
+    # Given: a service which has been called once
+    class Service(FireService):
+        a = IntegerField()
+        b = IntegerField()
+
+        def fire(self, **kwargs):
+            pass
+
+    Service().call({'a': 1, 'b': 2})
+    schema = Service._get_schema()
+
+    # When: calling it again
+    Service().call({'a': 3, 'b': 4})
+
+    # Then: the same compiled schema is reused
+    assert Service._get_schema() is schema
+    assert schema.names == frozenset(['a', 'b'])
+    assert [name for name, _ in schema.fields] == ['a', 'b']
+
+
+def test_schema_invalidated_when_field_added_after_creation():
+    # Given: a service which has been called once
+    class Service(FireService):
+        a = IntegerField()
+
+        def fire(self, **kwargs):
+            pass
+
+    Service().call({'a': 1})
+    with pytest.raises(UnknownParameterError):
+        Service().call({'a': 1, 'b': 2})
+
+    # When: a field is added to the class
+    Service.b = IntegerField(min_value=1)
+
+    # Then: the new field is accepted and validated
+    s = Service()
+    s.call({'a': 1, 'b': 2})
+    assert s.b == 2
+    with pytest.raises(ValidationError):
+        Service().call({'a': 1, 'b': 0})
+
+    # When: the field is removed again
+    del Service.b
+
+    # Then: it is unknown again
+    with pytest.raises(UnknownParameterError):
+        Service().call({'a': 1, 'b': 2})
+
+
+def make_typed_service(compiled):
+    class Service(FireService, compiled=compiled):
+        a = IntegerField(min_value=1, max_value=10)
+        b = StringField(min_length=2, validators=[required(), length(max_length=4)])
+        c = BooleanField(validators=[not_required()])
+        d = EmailField(default='a@b.com')
+        e = ListField(IntegerField())
+        f = IDField()
+
+        def fire(self, **kwargs):
+            return kwargs
+
+    return Service
+
+
+class IDField(StringField):
+    def default_validator(self, value):
+        super().default_validator(value)
+        if len(value.split('-')) != 3:
+            raise ValidationError(self.name, 'Improper format')
+
+
+VALID_INPUT = {'a': 5, 'b': 'abc', 'e': [1, 2], 'f': 'x-y-z'}
+
+
+@pytest.mark.parametrize('input', [
+    {**VALID_INPUT, 'a': 0},
+    {**VALID_INPUT, 'a': 11},
+    {**VALID_INPUT, 'a': 1.5},
+    {**VALID_INPUT, 'b': 'a'},
+    {**VALID_INPUT, 'b': 'abcde'},
+    {**VALID_INPUT, 'b': None},
+    {**VALID_INPUT, 'c': 1},
+    {**VALID_INPUT, 'd': 'aaa.com'},
+    {**VALID_INPUT, 'e': [1, 'a']},
+    {**VALID_INPUT, 'f': 'x-y'},
+])
+def test_compiled_service_raises_same_errors(input):
+    # Given: the same service in generic and compiled mode
+    errors = []
+    for compiled in (False, True):
+        # When: calling with invalid input
+        # Then: both raise the same error
+        with pytest.raises(ValidationError) as ex:
+            make_typed_service(compiled)().call(input)
+        errors.append((ex.value.field, ex.value.error))
+    assert errors[0] == errors[1]
+
+
+def test_compiled_service_sets_values():
+    # Given: a compiled service
+    Service = make_typed_service(True)
+    s = Service()
+
+    # When: calling with valid input
+    assert s.call(VALID_INPUT, x=1) == {'x': 1}
+
+    # Then: values and defaults are set, generated source is kept and fields stay immutable
+    assert (s.a, s.b, s.c, s.d, s.e, s.f) == (5, 'abc', None, 'a@b.com', [1, 2], 'x-y-z')
+    assert 'def _process_input' in Service._get_schema().source
+    with pytest.raises(ModificationError):
+        s.a = 2
+    with pytest.raises(ModificationError):
+        s.call(VALID_INPUT)
+
+
+def test_concurrent_calls_do_not_share_state():
+    # Given: a service with nested list fields
+    class Service(FireService):
+        a = IntegerField()
+        b = ListField(ListField(IntegerField(min_value=0)))
+
+        def fire(self, **kwargs):
+            return self.a, self.b
+
+    def run(i):
+        value = [[i] * (i % 7), [i, i + 1]]
+        if i % 3 == 0:
+            value[1][1] = -1
+        try:
+            return Service().call({'a': i, 'b': value})
+        except ValidationError as ex:
+            return ex.field, ex.error
+
+    # When: calling it from many threads at once, switching threads as often as possible
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(run, range(3000)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    # Then: every call sees only its own values and errors
+    for i, result in enumerate(results):
+        if i % 3 == 0:
+            assert result == ('b[1][1]', 'Given value: -1 is less than min: 0')
+        else:
+            assert result == (i, [[i] * (i % 7), [i, i + 1]])
+
+
+class DoubleService(FireService):
+    a = IntegerField(min_value=1)
+
+    def fire(self, **kwargs):
+        return self.a * kwargs.get('factor', 2)
+
+
+def test_call_many_collects_results_and_errors_in_order():
+    # Given: a batch with invalid inputs
+    inputs = [{'a': 1}, {'a': 0}, {'b': 1}, {'a': 3}]
+
+    # When: calling in collect mode
+    results = list(DoubleService.call_many(inputs, fail_fast=False, factor=3))
+
+    # Then: each input gets its own result in order
+    assert [r.value for r in results] == [3, None, None, 9]
+    assert results[0].error is None
+    assert isinstance(results[1].error, ValidationError)
+    assert isinstance(results[2].error, UnknownParameterError)
+    assert results[3].error is None
+
+
+def test_call_many_fail_fast_raises_first_error():
+    # Given: a batch with an invalid input
+    inputs = iter([{'a': 1}, {'a': 0}, {'a': 3}])
+    results = DoubleService.call_many(inputs)
+
+    # When: consuming the results
+    # Then: values are streamed up to the first error which is raised
+    assert next(results).value == 2
+    with pytest.raises(ValidationError):
+        next(results)
+    assert next(inputs) == {'a': 3}
+
+
+def test_acall_awaits_coroutine_callbacks():
+    # Given: a service with coroutine callbacks
+    calls = []
+
+    class Service(FireService):
+        a = IntegerField(min_value=1)
+
+        async def pre_fire(self):
+            calls.append('pre_fire')
+            if self.a == 2:
+                raise SkipError()
+
+        async def fire(self, **kwargs):
+            await asyncio.sleep(0)
+            return self.a * kwargs['factor']
+
+        def post_fire(self, fired, exc):
+            calls.append((fired, type(exc)))
+
+    # When: awaiting calls
+    # Then: callbacks are awaited with the same skip semantics as call()
+    assert asyncio.run(Service().acall({'a': 3}, factor=2)) == 6
+    assert asyncio.run(Service().acall({'a': 2}, factor=2)) is None
+    assert calls == ['pre_fire', (True, type(None)), 'pre_fire', (False, SkipError)]
+    with pytest.raises(ValidationError):
+        asyncio.run(Service().acall({'a': 0}))
+
+
+def test_acall_many_bounds_concurrency_and_keeps_order():
+    # Given: a service tracking the calls in flight
+    in_flight = []
+    peak = []
+
+    class Service(FireService):
+        a = IntegerField(min_value=0)
+
+        async def fire(self, **kwargs):
+            in_flight.append(self.a)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.001 * (self.a % 3))
+            in_flight.remove(self.a)
+            return self.a
+
+    inputs = [{'a': i} for i in range(50)] + [{'a': -1}]
+
+    # When: running a batch with bounded concurrency
+    results = asyncio.run(Service.acall_many(inputs, concurrency=5, fail_fast=False))
+
+    # Then: at most 5 calls run at once and results keep the input order
+    assert max(peak) == 5
+    assert [r.value for r in results] == list(range(50)) + [None]
+    assert isinstance(results[-1].error, ValidationError)
+    with pytest.raises(ValidationError):
+        asyncio.run(Service.acall_many(inputs, concurrency=5))
+
+
+class PowerService(FireService):
+    a = IntegerField(min_value=0)
+    b = ListField(IntegerField())
+
+    def pre_fire(self):
+        if self.a == 0:
+            raise SkipError('Nothing to do')
+
+    def fire(self, **kwargs):
+        return [(value ** self.a) % kwargs['mod'] for value in self.b], os.getpid()
+
+    def post_fire(self, fired, exc):
+        if not fired:
+            raise exc
+
+
+def test_submit_runs_validated_service_in_worker_process():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        # When: submitting a valid input
+        future = PowerService.submit({'a': 3, 'b': (2, 3)}, executor, mod=5)
+
+        # Then: the service runs in a worker process with the validated values
+        values, pid = future.result()
+        assert values == [3, 2]
+        assert pid != os.getpid()
+
+        # Then: post_fire runs in the worker and its errors come back pickled
+        with pytest.raises(SkipError):
+            PowerService.submit({'a': 0, 'b': []}, executor, mod=5).result()
+
+        # Then: invalid input is rejected in the calling process
+        with pytest.raises(ValidationError):
+            PowerService.submit({'a': -1, 'b': []}, executor, mod=5)
+
+
+def test_map_returns_results_in_order():
+    # Given: a batch of inputs
+    inputs = [{'a': i, 'b': [2]} for i in range(1, 9)]
+
+    # When: mapping them on worker processes
+    # Then: results are in order
+    assert [values for values, _ in PowerService.map(inputs, mod=1000)] == [[2 ** i] for i in range(1, 9)]
+
+
+def test_errors_and_services_are_picklable():
+    error = pickle.loads(pickle.dumps(ValidationError('a[0]', 'Not of int type')))
+    assert (error.field, error.error, str(error)) == ('a[0]', 'Not of int type', 'Field "a[0]": Not of int type')
+    assert isinstance(pickle.loads(pickle.dumps(SkipError('skip'))), SkipError)
+
+    service = PowerService()
+    service.call({'a': 1, 'b': [3]}, mod=2)
+    service = pickle.loads(pickle.dumps(service))
+    assert (service.a, service.b) == (1, [3])
+    with pytest.raises(ModificationError):
+        service.a = 2
+
+
+class CollectingService(FireService, collect_errors=True, max_errors=5):
+    a = IntegerField(min_value=1)
+    b = ListField(ListField(IntegerField(min_value=0)))
+    c = StringField()
+
+    def fire(self, **kwargs):
+        pass
+
+
+def test_collect_errors_reports_every_invalid_field():
+    # Given: a service in collect_errors mode
+    # When: calling with several invalid fields and list items
+    with pytest.raises(AggregateValidationError) as ex:
+        CollectingService().call({'a': 0, 'b': [[1, -1], 'x', [-2]]})
+
+    # Then: all errors are raised at once keyed by path
+    assert list(ex.value.errors) == ['a', 'b[0][1]', 'b[1]', 'b[2][0]', 'c']
+    assert not ex.value.truncated
+    assert str(ex.value) == 'Field "a": 5 validation errors'
+    assert ex.value.errors['b[0][1]'].error == 'Given value: -1 is less than min: 0'
+    assert isinstance(ex.value, ValidationError)
+    assert ex.value.field == 'a'
+
+
+def test_collect_errors_is_capped():
+    # Given: a payload with many invalid items
+    # When: calling in collect_errors mode
+    with pytest.raises(AggregateValidationError) as ex:
+        CollectingService().call({'a': 1, 'b': [[-1] * 1000] * 1000, 'c': 'c'})
+
+    # Then: validation stops at max_errors
+    assert len(ex.value.errors) == 5
+    assert ex.value.truncated
+
+
+def test_collect_errors_sets_values_when_valid():
+    s = CollectingService()
+    s.call({'a': 1, 'b': [(1,)], 'c': 'c'})
+    assert (s.a, s.b, s.c) == (1, [[1]], 'c')
+
+
+def make_slotted_service(compiled):
+    class Service(FireService, slots=True, compiled=compiled):
+        __slots__ = ('client',)
+        a = IntegerField(min_value=1)
+        b = ListField(IntegerField(), validators=[not_required()])
+
+        def __init__(self):
+            self.client = object()
+
+        def fire(self, **kwargs):
+            return self.a
+
+    return Service
+
+
+class SlottedService(FireService, slots=True):
+    a = IntegerField(min_value=1)
+    b = ListField(IntegerField(), validators=[not_required()])
+
+    def fire(self, **kwargs):
+        pass
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_slotted_service_stores_fields_in_slots(compiled):
+    # Given: a service declared with slots
+    Service = make_slotted_service(compiled)
+    s = Service()
+
+    # When: calling it
+    assert s.call({'a': 2, 'b': (1,)}) == 2
+
+    # Then: values live in slots and are frozen after processing the input
+    assert not hasattr(s, '__dict__')
+    assert (s.a, s.b) == (2, [1])
+    with pytest.raises(ModificationError):
+        s.a = 3
+    with pytest.raises(ModificationError):
+        s.call({'a': 2})
+    s.client = None
+    with pytest.raises(AttributeError):
+        s.c = 1
+    with pytest.raises(ValidationError):
+        Service().call({'a': 0})
+
+
+def test_slotted_service_pickles_and_rejects_new_fields():
+    s = SlottedService()
+    s.call({'a': 2})
+    s = pickle.loads(pickle.dumps(s))
+    assert (s.a, s.b) == (2, None)
+    with pytest.raises(ModificationError):
+        s.a = 3
+    with pytest.raises(FireServiceError):
+        SlottedService.c = IntegerField()
+
+
+@pytest.mark.parametrize('slots', [False, True])
+def test_pool_reuses_and_resets_instances(slots):
+    # Given: a pool of services with expensive setup
+    setups = []
+
+    class Service(FireService, slots=slots):
+        if slots:
+            __slots__ = ('client',)
+        a = IntegerField(min_value=1)
+        b = IntegerField(validators=[not_required()])
+
+        def __init__(self):
+            self.client = object()
+            setups.append(self.client)
+
+        def fire(self, **kwargs):
+            return self.a, self.b, self.client
+
+    pool = Service.pool(size=2)
+
+    # When: calling it more times than its size, with failures in between
+    results = [pool.call({'a': 1, 'b': 2}), pool.call({'a': 3})]
+    with pytest.raises(ValidationError):
+        pool.call({'a': 0})
+    results.append(pool.call({'a': 4}))
+
+    # Then: instances are reused with fresh field values
+    assert len(setups) == 2
+    assert [result[:2] for result in results] == [(1, 2), (3, None), (4, None)]
+    assert set(result[2] for result in results) <= set(setups)
+    assert pool.idle == 2
+
+
+def test_pool_waits_for_idle_instance():
+    pool = DoubleService.pool(size=1)
+    with pool.acquire() as service:
+        assert service.call({'a': 2}) == 4
+        with pytest.raises(FireServiceError):
+            pool.call({'a': 1}, timeout=0.01)
+    assert pool.call({'a': 1}) == 2
+
+
+class BaseService(FireService):
+    a = IntegerField(min_value=1)
+    b = StringField()
+    c = IntegerField()
+
+    def fire(self, **kwargs):
+        return {name: getattr(self, name) for name in type(self)._get_schema().names}
+
+
+def test_fields_are_inherited_with_overrides_in_place():
+    # Given: a subclass overriding and adding fields
+    class Service(BaseService):
+        a = IntegerField(min_value=10)
+        d = BooleanField()
+
+    # Then: inherited fields keep their declaration order and overrides apply
+    assert [name for name, _ in Service._get_fields(Service)] == ['a', 'b', 'c', 'd']
+    assert Service().call({'a': 10, 'b': 'x', 'c': 1, 'd': True}) == {'a': 10, 'b': 'x', 'c': 1, 'd': True}
+    with pytest.raises(ValidationError):
+        Service().call({'a': 5, 'b': 'x', 'c': 1, 'd': True})
+    assert BaseService().call({'a': 5, 'b': 'x', 'c': 1})['a'] == 5
+
+
+def test_shadowed_inherited_field_is_removed():
+    # Given: a subclass shadowing a field with a plain attribute
+    class Service(BaseService):
+        c = 3
+
+    # Then: the field is no longer accepted, and fields of deeper subclasses are merged
+    with pytest.raises(UnknownParameterError):
+        Service().call({'a': 1, 'b': 'x', 'c': 1})
+
+    class SubService(Service):
+        e = IntegerField(validators=[not_required()])
+
+    assert SubService().call({'a': 1, 'b': 'x'}) == {'a': 1, 'b': 'x', 'e': None}
+    with pytest.raises(UnknownParameterError):
+        SubService().call({'a': 1, 'b': 'x', 'z': 1})
+
+
+def test_subclass_schema_invalidated_when_base_changes():
+    # Given: a base and a subclass which has been called
+    class Base(FireService):
+        a = IntegerField()
+
+        def fire(self, **kwargs):
+            return getattr(self, 'b', None)
+
+    class Service(Base):
+        pass
+
+    assert Service().call({'a': 1}) is None
+
+    # When: a field is added to the base
+    Base.b = IntegerField(validators=[not_required()])
+
+    # Then: the subclass accepts it
+    assert Service().call({'a': 1, 'b': 2}) == 2
+
+
+def test_schema_invalidated_when_inherited_field_shadowed():
+    # Given: a subclass which has been called with an inherited field
+    class Base(FireService):
+        a = IntegerField()
+        b = IntegerField(validators=[not_required()])
+
+        def fire(self, **kwargs):
+            return self.b
+
+    class Service(Base):
+        pass
+
+    assert Service().call({'a': 1, 'b': 2}) == 2
+
+    # When: the inherited field is shadowed by a plain attribute
+    Service.a = 7
+
+    # Then: it is no longer accepted
+    with pytest.raises(UnknownParameterError):
+        Service().call({'a': 1})
+    assert Service().call({'b': 2}) == 2
+
+    # When: the shadowing attribute is removed
+    del Service.a
+
+    # Then: the inherited field is validated again
+    with pytest.raises(ValidationError):
+        Service().call({'b': 2})
+
+
+@pytest.mark.parametrize('base_slots, slots, compiled', [
+    (False, True, False),
+    (True, False, False),
+    (True, True, False),
+    (False, True, True),
+    (True, False, True),
+])
+def test_inherited_fields_with_slots(base_slots, slots, compiled):
+    # Given: a hierarchy mixing slotted and regular classes
+    class Base(FireService, slots=base_slots):
+        a = IntegerField(min_value=1)
+
+        def fire(self, **kwargs):
+            return self.a, self.b
+
+    class Service(Base, slots=slots, compiled=compiled):
+        b = ListField(IntegerField())
+
+    # When: calling the subclass
+    pool = Service.pool(size=1)
+    assert pool.call({'a': 1, 'b': [2]}) == (1, [2])
+
+    # Then: all fields are set, frozen, and reset in pools
+    s = Service()
+    s.call({'a': 3, 'b': []})
+    with pytest.raises(ModificationError):
+        s.a = 4
+    with pytest.raises(ModificationError):
+        s.b = [4]
+    with pytest.raises(ValidationError):
+        pool.call({'a': 0, 'b': []})
+    assert pool.call({'a': 5, 'b': [6]}) == (5, [6])
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_call_json_parses_and_coerces(compiled):
+    # Given: a service with coercing fields
+    class Service(FireService, compiled=compiled):
+        a = IntegerField(coerce=True, min_value=1)
+        b = DateField(coerce=True)
+        c = ListField(StringField())
+
+        def fire(self, **kwargs):
+            return self.a, self.b, self.c
+
+    # When: calling it with JSON
+    # Then: values are decoded and coerced in one go
+    assert Service().call_json(b'{"a": "3", "b": "2019-12-04", "c": ["x"]}') == (3, date(2019, 12, 4), ['x'])
+    with pytest.raises(ValidationError):
+        Service().call_json('{"a": "0", "b": "2019-12-04", "c": []}')
+    with pytest.raises(FireServiceError):
+        Service().call_json('[1]')
+    with pytest.raises(ValueError):
+        Service().call_json('{')
+
+
+def make_address_service(compiled):
+    class Address(FireService, compiled=compiled):
+        city = StringField(min_length=1)
+        zip = IntegerField(validators=[not_required()], default=0)
+
+    return Address
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_schema_field_validates_nested_dicts(compiled):
+    # Given: a service nesting another service as a field and as list items
+    Address = make_address_service(compiled)
+
+    class Service(FireService, compiled=compiled):
+        home = SchemaField(Address)
+        others = ListField(SchemaField(Address), validators=[not_required()], default=[])
+
+        def fire(self, **kwargs):
+            return self.home, self.others
+
+    # When: calling it with valid nested dicts
+    # Then: nested values are validated and defaulted
+    assert Service().call({'home': {'city': 'Pune'}, 'others': [{'city': 'Goa', 'zip': 403001}]}) == \
+        ({'city': 'Pune', 'zip': 0}, [{'city': 'Goa', 'zip': 403001}])
+
+    # When: calling it with invalid nested dicts
+    # Then: errors are reported with nested paths
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'home': {'city': ''}})
+    assert (ex.value.field, ex.value.code) == ('home.city', 'min_length')
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'home': {'city': 'Pune'}, 'others': [{'city': 'Goa'}, {'city': 'Goa', 'state': 'GA'}]})
+    assert (ex.value.field, ex.value.code) == ('others[1].state', 'unknown')
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'home': []})
+    assert (ex.value.field, ex.value.code) == ('home', 'type')
+
+
+def test_schema_field_collects_nested_errors():
+    # Given: a service in collect_errors mode with nested dicts
+    Address = make_address_service(False)
+
+    class Service(FireService, collect_errors=True):
+        home = SchemaField(Address)
+        others = ListField(SchemaField(Address))
+
+        def fire(self, **kwargs):
+            pass
+
+    # When: calling it with several invalid nested values
+    with pytest.raises(AggregateValidationError) as ex:
+        Service().call({'home': {'city': 1, 'zip': 'x'}, 'others': [{'city': 'Goa'}, {'zip': 1}]})
+
+    # Then: every nested error is keyed by its path
+    assert list(ex.value.errors) == ['home.city', 'home.zip', 'others[1].city']
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_lazy_field_validated_on_first_read(compiled):
+    # Given: a service with a lazy list field, skipping negative ids
+    validated = []
+
+    def record(name, value):
+        validated.append(value)
+
+    class Service(FireService, compiled=compiled):
+        a = IntegerField()
+        b = ListField(IntegerField(min_value=0), lazy=True, validators=[required(), record])
+
+        def pre_fire(self):
+            if self.a < 0:
+                raise SkipError()
+
+        def fire(self, **kwargs):
+            return self.b is self.b, sum(self.b)
+
+    # When: a call is skipped
+    # Then: the lazy field is never validated, even if invalid
+    assert Service().call({'a': -1, 'b': [-1]}) is None
+    assert validated == []
+
+    # When: the field is read
+    # Then: it is validated once and the value is kept
+    assert Service().call({'a': 1, 'b': [1, 2]}) == (True, 3)
+    assert validated == [[1, 2]]
+
+    # When: an invalid lazy field is read
+    # Then: the read raises
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'a': 1, 'b': [1, -2]})
+    assert ex.value.field == 'b[1]'
+
+
+def test_lazy_field_is_immutable_and_rejected_with_slots():
+    # Given: a called service with a lazy field
+    class Service(FireService):
+        a = IntegerField(lazy=True)
+
+        def fire(self, **kwargs):
+            pass
+
+    service = Service()
+    service.call({'a': 1})
+
+    # Then: the field can't be modified before or after being read
+    with pytest.raises(ModificationError):
+        service.a = 2
+    assert service.a == 1
+    with pytest.raises(ModificationError):
+        service.a = 2
+
+    # Then: lazy fields can't be slotted
+    with pytest.raises(FireServiceError):
+        class Slotted(FireService, slots=True):
+            a = IntegerField(lazy=True)
+
+
+def make_ordered_service(compiled, validation_order, validated):
+    def record(name, value):
+        validated.append(name)
+
+    class Service(FireService, compiled=compiled, validation_order=validation_order):
+        items = ListField(IntegerField(validators=[required(), record]))
+        name = StringField()
+        count = IntegerField(min_value=0)
+
+        def fire(self, **kwargs):
+            return [name for name in vars(self) if not name.startswith('_')]
+
+    return Service
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_cheap_fields_validated_first(compiled):
+    # Given: a service declaring an expensive list before cheap fields
+    validated = []
+    Service = make_ordered_service(compiled, None, validated)
+
+    # When: a cheap field is invalid
+    # Then: it is reported without validating any list item
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'items': [1, 2, 3], 'name': 'a', 'count': -1})
+    assert (ex.value.field, ex.value.code) == ('count', 'min_value')
+    assert validated == []
+
+    # When: a required field is missing
+    # Then: it is reported before validating any field
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'items': [1, 2, 3], 'name': 1})
+    assert (ex.value.field, ex.value.code) == ('count', 'required')
+    assert validated == []
+
+    # When: the input is valid
+    # Then: fields are assigned in validation order
+    assert Service().call({'items': [1], 'name': 'a', 'count': 1}) == ['name', 'count', 'items']
+    assert validated == ['']
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_declaration_validation_order(compiled):
+    # Given: a service validating fields in declaration order
+    validated = []
+    Service = make_ordered_service(compiled, 'declaration', validated)
+
+    # When: several fields are invalid
+    # Then: the first declared one is reported
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'items': [1, 'x'], 'count': -1})
+    assert ex.value.field == 'items[1]'
+
+    # Then: fields are assigned in declaration order
+    assert Service().call({'items': [], 'name': 'a', 'count': 1}) == ['items', 'name', 'count']
+
+    # Then: other orders are rejected
+    with pytest.raises(ValueError):
+        class Invalid(FireService, validation_order='random'):
+            pass
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_nested_values_keep_declaration_order(compiled):
+    # Given: a nested schema validated cheapest first
+    class Inner(FireService, compiled=compiled):
+        tags = ListField(StringField())
+        email = EmailField()
+        id = IntegerField()
+
+    class Service(FireService, compiled=compiled):
+        inner = SchemaField(Inner)
+
+        def fire(self, **kwargs):
+            return self.inner
+
+    # When: calling it
+    # Then: the nested dict keeps the declared key order
+    value = Service().call({'inner': {'id': 1, 'email': 'a@b.c', 'tags': []}})
+    assert list(value) == ['tags', 'email', 'id']
+
+    # When: a nested required field is missing
+    # Then: it is reported with its path
+    with pytest.raises(ValidationError) as ex:
+        Service().call({'inner': {'tags': [1]}})
+    assert (ex.value.field, ex.value.code) == ('inner.id', 'required')
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_recursive_schema_field(compiled):
+    # Given: a tree node service holding a list of nodes
+    class Node(FireService, compiled=compiled):
+        value = IntegerField()
+
+        def fire(self, **kwargs):
+            return self.value + sum(child['value'] for child in self.children)
+
+    Node.children = ListField(SchemaField(Node), validators=[not_required()], default=[])
+
+    # When: calling it with nested nodes
+    # Then: every level is validated
+    assert Node().call({'value': 1, 'children': [{'value': 2, 'children': [{'value': 3}]}]}) == 3
+    with pytest.raises(ValidationError) as ex:
+        Node().call({'value': 1, 'children': [{'value': 2, 'children': [{'value': 'x'}]}]})
+    assert ex.value.field == 'children[0].children[0].value'